@@ -1,27 +1,73 @@
+__version__ = "0.1.0"
+
+from .context import ColumnProfile, ProfileContext
 from .profiling import dataset_overview
 from .missing import missing_report
-from .stats import numeric_summary
+from .stats import NumericSummaryState, numeric_summary
 from .outliers import outlier_detect
 from .interpret import interpret_distribution
-from .alert import _generate_alerts
+from .alert import (
+    AlertRule,
+    _generate_alerts,
+    alert_rules,
+    evaluate_alerts,
+    register_alert_rule,
+    unregister_alert_rule
+)
 from .corr import (
+    CorrelationResult,
+    correlation_result,
     top_correlated_pairs,
     full_correlation_heatmap
 )
-from .quick_eda import quick_eda
-from .report import eda_report
+from .cache import ResultCache, column_fingerprint, table_fingerprint
+from .duplicates import duplicate_summary
+from .histograms import Histogram, compute_histograms
+from .quick_eda import EDAResult, quick_eda
+from .persist import SavedProfile, diff_profiles, load_profile, save_profile
+from .export import eda_tables, export_json, export_parquet
+from .report import eda_report, eda_report_from_csv, eda_report_from_parquet
+from .streaming import StreamingProfiler, profile
 
 __all__ = [
+    "ColumnProfile",
+    "ProfileContext",
     "dataset_overview",
     "missing_report",
     "numeric_summary",
+    "NumericSummaryState",
     "outlier_detect",
     "interpret_distribution",
     "_generate_alerts",
+    "AlertRule",
+    "alert_rules",
+    "evaluate_alerts",
+    "register_alert_rule",
+    "unregister_alert_rule",
     "resolve_target",
+    "CorrelationResult",
+    "correlation_result",
     "top_correlated_pairs", 
     "target_correlation_plot",
     "full_correlation_heatmap",
+    "ResultCache",
+    "column_fingerprint",
+    "table_fingerprint",
+    "duplicate_summary",
+    "Histogram",
+    "compute_histograms",
+    "EDAResult",
     "quick_eda",
-    "eda_report"
+    "SavedProfile",
+    "diff_profiles",
+    "load_profile",
+    "save_profile",
+    "eda_tables",
+    "export_json",
+    "export_parquet",
+    "eda_report",
+    "eda_report_from_csv",
+    "eda_report_from_parquet",
+    "StreamingProfiler",
+    "profile"
 ]
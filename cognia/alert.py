@@ -1,73 +1,224 @@
+import hashlib
+from dataclasses import dataclass
+
+import numpy as np
 import pandas as pd
 
-def _generate_alerts(df, stats_df, outliers_df, missing_df):
-    alerts = []
-    n_rows = len(df)
-
-    # ---------------- Missing value alerts ----------------
-    if missing_df is not None and not missing_df.empty:
-        for col, row in missing_df.iterrows():
-            if row["missing_percent"] > 5:
-                alerts.append(
-                    f"{col} has {row['missing_percent']}% missing values"
-                )
-
-    # ---------------- Numeric column alerts ----------------
-    for col in df.select_dtypes(include="number").columns:
-        series = df[col].dropna()
-
-        if series.empty:
-            continue
-
-        unique_vals = series.nunique()
-        value_counts = series.value_counts(normalize=True)
-
-        # 🔹 Case 1: Constant column
-        if unique_vals == 1:
-            alerts.append(
-                f"{col} has a single constant value ({series.iloc[0]})"
-            )
-            continue
-
-        # 🔹 Case 2: Continuous numeric → skewness
-        # ---- Continuous numeric → skewness (SMART) ----
-        if stats_df is not None and col in stats_df.index:
-            skew = stats_df.loc[col, "skewness"]
-            std = stats_df.loc[col, "std"]
-
-            if pd.notna(skew) and pd.notna(std):
-                # Ignore near-constant columns
-                if std == 0:
-                    pass
-
-                # Severe skew only
-                elif abs(skew) > 3:
-                    direction = "right" if skew > 0 else "left"
-                    alerts.append(
-                        f"{col} is severely {direction}-skewed (skew = {round(skew, 2)})"
-                    )   
-
-                # Moderate skew → informational only (optional)
-                elif abs(skew) > 1.5:
-                    alerts.append(
-                        f"{col} has moderate skewness (skew = {round(skew, 2)})"
-                    )
-
-    # ---------------- Outlier alerts ----------------
-    if outliers_df is not None and not outliers_df.empty:
-        for _, row in outliers_df.iterrows():
-            if row["outlier_percent"] > 10:
-                alerts.append(
-                    f"{row['column']} has {row['outlier_percent']}% outliers"
-                )
-
-    # ---------------- High-cardinality categorical ----------------
-    for col in df.select_dtypes(exclude="number").columns:
-        unique_ratio = df[col].nunique() / n_rows
-        if unique_ratio > 0.2:
-            alerts.append(
-                f"{col} has high cardinality ({df[col].nunique()} unique values)"
-            )
-
-    return alerts
+from .context import _get_context
+
+
+# ---------------- Rules ----------------
+
+@dataclass(frozen=True)
+class AlertRule:
+    """
+    A data quality check over the per-column profile table.
+
+    ``predicate(table, threshold)`` returns a boolean mask with one entry
+    per table row (i.e. per column). Every matching column raises an alert
+    whose text is ``message.format(column=..., threshold=..., **row)``, or
+    ``message(row)`` when message is callable.
+
+    Alerts are listed by category, in column order or, with order_by, by
+    that table field from largest to smallest.
+    """
+    name: str
+    predicate: object
+    message: object
+    threshold: float = None
+    severity: str = "warning"
+    category: str = "general"
+    order_by: str = None
+
+
+_RULES = []
+
+
+def register_alert_rule(rule: AlertRule):
+    """
+    Adds a rule (replacing any rule of the same name) to those evaluated
+    by every report.
+    """
+    unregister_alert_rule(rule.name)
+    _RULES.append(rule)
+
+
+def unregister_alert_rule(name):
+    _RULES[:] = [r for r in _RULES if r.name != name]
+
+
+def alert_rules() -> list:
+    return list(_RULES)
+
+
+def _callable_key(func):
+    # Stable across processes: the code and the values it closes over
+    code = func.__code__
+    cells = tuple(c.cell_contents for c in func.__closure__ or ())
+    return (func.__qualname__, code.co_code, repr(code.co_consts), repr(cells))
+
+
+def _rules_fingerprint(rules) -> str:
+    """
+    Digest of a rule set, e.g. to key cached reports by the rules whose
+    alerts they hold.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for r in rules:
+        message = r.message if isinstance(r.message, str) else _callable_key(r.message)
+        digest.update(repr((
+            r.name, r.threshold, r.severity, r.category, r.order_by,
+            message, _callable_key(r.predicate)
+        )).encode())
+    return digest.hexdigest()
+
+
+def _skew_message(kind):
+    def message(row):
+        skew = round(row["skewness"], 2)
+        if kind == "severe":
+            direction = "right" if row["skewness"] > 0 else "left"
+            return f"{row['column']} is severely {direction}-skewed (skew = {skew})"
+        return f"{row['column']} has moderate skewness (skew = {skew})"
+    return message
+
+
+def _skew_known(t):
+    # Constant (and near-constant) columns have no meaningful skew
+    return (
+        t["is_numeric"] & ~t["is_constant"] & (t["count"] > 0)
+        & t["skewness"].notna() & t["std"].notna() & (t["std"] != 0)
+    )
+
+
+def _severe_skew_threshold():
+    # Moderate skew stops where the registered severe_skew rule starts
+    for rule in _RULES:
+        if rule.name == "severe_skew":
+            return rule.threshold
+    return np.inf
+
+
+for _rule in [
+    AlertRule(
+        "high_missing",
+        lambda t, th: t["missing_percent"] > th,
+        "{column} has {missing_percent}% missing values",
+        threshold=5, category="missing", order_by="missing_percent"
+    ),
+    AlertRule(
+        "constant",
+        lambda t, th: t["is_numeric"] & t["is_constant"],
+        "{column} has a single constant value ({min})",
+        category="distribution"
+    ),
+    AlertRule(
+        "severe_skew",
+        lambda t, th: _skew_known(t) & (t["skewness"].abs() > th),
+        _skew_message("severe"),
+        threshold=3, category="distribution"
+    ),
+    AlertRule(
+        "moderate_skew",
+        lambda t, th: (
+            _skew_known(t) & (t["skewness"].abs() > th)
+            & (t["skewness"].abs() <= _severe_skew_threshold())
+        ),
+        _skew_message("moderate"),
+        threshold=1.5, severity="info", category="distribution"
+    ),
+    AlertRule(
+        "high_outliers",
+        lambda t, th: t["outlier_percent"] > th,
+        "{column} has {outlier_percent}% outliers",
+        threshold=10, category="outliers"
+    ),
+    AlertRule(
+        "high_cardinality",
+        lambda t, th: ~t["is_numeric"] & (t["unique_ratio"] > th),
+        "{column} has high cardinality ({n_unique} unique values)",
+        threshold=0.2, category="cardinality"
+    ),
+]:
+    register_alert_rule(_rule)
+
+
+# ---------------- Profile table ----------------
+
+def _profile_table(ctx, stats_df, outliers_df, missing_df) -> pd.DataFrame:
+    """
+    One row per column with the fields alert rules read, taken from the
+    context's profiles and the already computed report sections.
+    """
+    profiles = [ctx.profile(col) for col in ctx.columns]
+    distinct = ctx.distinct_counts()
+    n_unique = [
+        distinct[p.name] if not p.is_numeric else np.nan for p in profiles
+    ]
+
+    table = pd.DataFrame({
+        "column": pd.Series(ctx.columns, dtype=object),
+        "is_numeric": [p.is_numeric for p in profiles],
+        "is_constant": [p.is_constant for p in profiles],
+        "count": [p.count for p in profiles],
+        "min": pd.Series([p.min for p in profiles], dtype=object),
+        "n_unique": pd.array(n_unique, dtype="Int64"),
+    })
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        table["unique_ratio"] = table["n_unique"].astype(float) / ctx.n_rows
+
+    # Section values as reported (i.e. rounded), aligned by column
+    def aligned(frame, field):
+        if frame is None or frame.empty or field not in frame:
+            return np.nan
+        return frame[field].reindex(table["column"]).to_numpy()
+
+    table["missing_percent"] = aligned(missing_df, "missing_percent")
+    table["std"] = aligned(stats_df, "std")
+    table["skewness"] = aligned(stats_df, "skewness")
+    table["outlier_percent"] = aligned(
+        outliers_df.set_index("column") if outliers_df is not None and not outliers_df.empty else None,
+        "outlier_percent"
+    )
+
+    return table
+
+
+# ---------------- Evaluation ----------------
+
+def evaluate_alerts(table: pd.DataFrame, rules=None) -> pd.DataFrame:
+    """
+    Evaluates rules (all registered rules by default) over a profile
+    table. Returns one row per alert with its column, rule, severity,
+    category and message, grouped by category (in rule order).
+    """
+    rules = alert_rules() if rules is None else list(rules)
+    categories = list(dict.fromkeys(r.category for r in rules))
+    found = []
+
+    for rank, rule in enumerate(rules):
+        mask = np.asarray(rule.predicate(table, rule.threshold), dtype=bool)
+        for position in np.flatnonzero(mask):
+            row = table.iloc[position].to_dict()
+            if callable(rule.message):
+                text = rule.message(row)
+            else:
+                text = rule.message.format(threshold=rule.threshold, **row)
+            order = -row[rule.order_by] if rule.order_by else 0
+            found.append((
+                categories.index(rule.category), order, position, rank,
+                row["column"], rule.name, rule.severity, rule.category, text
+            ))
+
+    found.sort(key=lambda alert: alert[:4])
+    return pd.DataFrame(
+        [alert[4:] for alert in found],
+        columns=["column", "rule", "severity", "category", "message"]
+    )
+
 
+def _generate_alerts(df, stats_df, outliers_df, missing_df, context=None):
+    ctx = _get_context(df, context)
+    table = _profile_table(ctx, stats_df, outliers_df, missing_df)
+    return evaluate_alerts(table)["message"].tolist()
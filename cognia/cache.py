@@ -0,0 +1,134 @@
+import hashlib
+import os
+import pickle
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+
+# ---------------- Fingerprints ----------------
+
+def column_fingerprint(series: pd.Series) -> str:
+    """
+    Content hash of a column: its name, dtype and values. Plain numpy
+    columns are hashed from their raw bytes, others from their value hashes.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((series.name, str(series.dtype), len(series))).encode())
+
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biufcmM":
+        values = np.ascontiguousarray(series.to_numpy())
+    else:
+        values = pd.util.hash_pandas_object(series, index=False).to_numpy()
+
+    digest.update(values.view(np.uint8))
+    return digest.hexdigest()
+
+
+def table_fingerprint(df: pd.DataFrame) -> tuple:
+    """
+    (column, fingerprint) pairs for every column, in column order.
+    """
+    return tuple(
+        (str(col), column_fingerprint(df.iloc[:, j])) for j, col in enumerate(df.columns)
+    )
+
+
+# ---------------- Result cache ----------------
+
+_MISSING = object()
+
+
+class ResultCache:
+    """
+    On-disk cache of computed results (report sections, rendered charts).
+
+    Each entry is a pickle file named by a hash of its key and the Cognia
+    version, so upgrading Cognia never reuses stale results. Reads mark an
+    entry as recently used; once the directory grows past max_size the
+    least recently used entries are removed.
+    """
+
+    def __init__(self, directory, max_size="1GB"):
+        # Imported here as corr depends on the context, which uses this module
+        from .corr import _parse_memory
+
+        self.directory = os.fspath(directory)
+        self.max_size = _parse_memory(max_size)
+        os.makedirs(self.directory, exist_ok=True)
+        # Running estimate of the directory size, so puts only list the
+        # directory once it may have outgrown max_size
+        self._size = None
+
+    def _path(self, key) -> str:
+        from . import __version__
+
+        name = hashlib.blake2b(repr((__version__, key)).encode(), digest_size=16)
+        return os.path.join(self.directory, name.hexdigest() + ".pkl")
+
+    def get(self, key, default=None):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return default
+
+        os.utime(path)
+        return value
+
+    def put(self, key, value):
+        # Written to a temporary file first so readers never see half an entry
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            size = f.tell()
+        os.replace(tmp, self._path(key))
+
+        if self._size is not None:
+            self._size += size
+        if self._size is None or self._size > self.max_size:
+            self._evict()
+
+    def cached(self, key, compute):
+        """
+        Returns the entry stored under key, calling compute() and storing
+        its result when there is none.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def _evict(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pkl"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._size = total
+
+    def clear(self):
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pkl"):
+                os.remove(entry.path)
+        self._size = 0
+
+
+def _open_cache(cache):
+    # eda_report takes a ResultCache or the directory of one
+    if cache is None or isinstance(cache, ResultCache):
+        return cache
+    return ResultCache(cache)
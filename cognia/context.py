@@ -0,0 +1,520 @@
+import threading
+import warnings
+
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+
+from .cache import column_fingerprint
+from .moments import _BLOCK_ROWS, finalize_moments, moment_kernel
+from .sketches import HyperLogLog, QuantileSketch, TopKSketch
+
+
+# ---------------- Column profile ----------------
+
+@dataclass
+class ColumnProfile:
+    """
+    Statistics gathered for a single column in one scan.
+    """
+    name: object
+    dtype: str
+    is_numeric: bool
+    count: int
+    null_count: int
+    mean: float = np.nan
+    std: float = np.nan
+    min: object = np.nan
+    q1: float = np.nan
+    median: float = np.nan
+    q3: float = np.nan
+    max: object = np.nan
+    skewness: float = np.nan
+    kurtosis: float = np.nan
+    outlier_count: int = 0
+    value_counts: pd.Series = None
+    n_distinct: int = None
+
+    @property
+    def is_constant(self) -> bool:
+        if self.count == 0:
+            return False
+        if self.is_numeric:
+            return self.min == self.max
+        return self.n_unique == 1
+
+    @property
+    def n_unique(self) -> int:
+        # Declared categories without rows keep a zero count in value_counts
+        if self.n_distinct is not None:
+            return self.n_distinct
+        return int((self.value_counts > 0).sum()) if self.value_counts is not None else 0
+
+
+def _native(value, dtype):
+    # Keep integer extrema printable as integers (e.g. in alerts)
+    if pd.notna(value) and pd.api.types.is_integer_dtype(dtype):
+        return int(value)
+    return value
+
+
+def _numeric_profiles(columns, dtypes, n_rows, stats, quartiles, outlier_counts) -> list:
+    """
+    Builds numeric ColumnProfiles from per-column arrays of finalized
+    moments, quartiles and outlier counts.
+    """
+    q1, median, q3 = quartiles
+    profiles = []
+
+    for j, (col, dtype) in enumerate(zip(columns, dtypes)):
+        count = int(stats["count"][j])
+        profiles.append(ColumnProfile(
+            name=col,
+            dtype=str(dtype),
+            is_numeric=True,
+            count=count,
+            null_count=n_rows - count,
+            mean=stats["mean"][j],
+            std=stats["std"][j],
+            min=_native(stats["min"][j], dtype),
+            q1=q1[j],
+            median=median[j],
+            q3=q3[j],
+            max=_native(stats["max"][j], dtype),
+            skewness=stats["skewness"][j],
+            kurtosis=stats["kurtosis"][j],
+            outlier_count=int(outlier_counts[j])
+        ))
+
+    return profiles
+
+
+def _scan_numeric_block(numeric_df: pd.DataFrame, quantile_error=None):
+    """
+    Profiles every numeric column at once: the block is converted to a
+    single float array, moments come from one pass of the moment kernel
+    and quartiles from one nanquantile call, or from per-column quantile
+    sketches when quantile_error is set.
+
+    Returns the profiles and the sketches (None in exact mode).
+    """
+    values = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+    stats = finalize_moments(moment_kernel(values))
+
+    sketches = None
+    if quantile_error is not None:
+        sketches = [
+            QuantileSketch.for_error(quantile_error).update(values[:, j])
+            for j in range(values.shape[1])
+        ]
+        q1, median, q3 = np.array(
+            [s.quantile([0.25, 0.5, 0.75]) for s in sketches]
+        ).reshape(-1, 3).T
+    elif len(values) == 0:
+        q1 = median = q3 = np.full(values.shape[1], np.nan)
+    else:
+        with warnings.catch_warnings():
+            # All-NaN columns legitimately yield NaN quartiles
+            warnings.simplefilter("ignore", RuntimeWarning)
+            q1, median, q3 = np.nanquantile(values, [0.25, 0.5, 0.75], axis=0)
+
+    # IQR (Tukey) fences for all columns at once, broadcast over row blocks
+    # to bound the size of the boolean temporaries. NaN never compares true.
+    iqr = q3 - q1
+    lower = q1 - 1.5 * iqr
+    upper = q3 + 1.5 * iqr
+    outlier_counts = np.zeros(values.shape[1], dtype=np.int64)
+    with np.errstate(invalid="ignore"):
+        for start in range(0, len(values), _BLOCK_ROWS):
+            block = values[start:start + _BLOCK_ROWS]
+            outlier_counts += ((block < lower) | (block > upper)).sum(axis=0)
+
+    # Constant columns have no outliers
+    outlier_counts[iqr == 0] = 0
+
+    profiles = _numeric_profiles(
+        numeric_df.columns, numeric_df.dtypes, len(values),
+        stats, (q1, median, q3), outlier_counts
+    )
+    return profiles, sketches
+
+
+def _factorize(series: pd.Series) -> tuple:
+    """
+    int32 codes (-1 for missing values) and the distinct values they index.
+    Categorical columns already carry both.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        uniques = pd.CategoricalIndex(series.cat.categories, dtype=series.dtype)
+    else:
+        codes, uniques = pd.factorize(series)
+    return codes.astype(np.int32, copy=False), uniques
+
+
+def _scan_categorical(name, dtype, codes, uniques) -> ColumnProfile:
+    # Same result as value_counts(), counted from the codes
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    counts = pd.Series(
+        counts, index=uniques.rename(name), name="count"
+    ).sort_values(ascending=False, kind="stable")
+    count = int(counts.sum())
+
+    return ColumnProfile(
+        name=name,
+        dtype=str(dtype),
+        is_numeric=False,
+        count=count,
+        null_count=len(codes) - count,
+        value_counts=counts
+    )
+
+
+# Values a categorical sketch keeps when only distinct_precision is set
+_DEFAULT_TOP_K = 1000
+
+
+def _scan_categorical_sketch(name, series: pd.Series, top_k, precision) -> tuple:
+    """
+    Profiles a non-numeric column in one blocked pass with bounded memory:
+    a Space-Saving sketch keeps the top_k most frequent values and a
+    HyperLogLog counter the number of distinct values. Returns the
+    profile and both sketches.
+    """
+    top = TopKSketch(capacity=top_k)
+    distinct = HyperLogLog(precision)
+
+    for start in range(0, len(series), _BLOCK_ROWS):
+        counts = series.iloc[start:start + _BLOCK_ROWS].value_counts()
+        top.update_counts(counts)
+        distinct.update(counts.index[counts > 0].to_series())
+
+    # Nothing was evicted: the counts are exact
+    counts = top.top(top_k)
+    count = int(series.count())
+    return ColumnProfile(
+        name=name,
+        dtype=str(series.dtype),
+        is_numeric=False,
+        count=count,
+        null_count=len(series) - count,
+        value_counts=counts,
+        n_distinct=distinct.count() if top.truncated else int((counts > 0).sum())
+    ), top, distinct
+
+
+# ---------------- Profile context ----------------
+
+class ProfileContext:
+    """
+    Shared store of column profiles for one EDA run.
+
+    Each column is scanned at most once, on first request, and the result
+    is reused by every section (missing values, statistics, outliers,
+    alerts and report charts). Numeric columns are scanned together as one
+    block. Scans are guarded by locks so stages running on a thread pool
+    can share one context.
+
+    With quantile_error set (e.g. 0.005 for 0.5% rank error) quartiles and
+    IQR fences come from mergeable quantile sketches instead of exact
+    quantiles; the sketches are kept in ``quantile_sketches``.
+
+    With memory_limit set (e.g. "2GB") correlations are computed tile by
+    tile within that budget instead of as one dense matrix.
+
+    With distinct_precision set (e.g. 14) distinct counts of large columns
+    are estimated with HyperLogLog counters of that precision, kept in
+    ``distinct_sketches``. Non-numeric columns with more rows than such a
+    counter keeps exactly are then profiled by the sketch scan below
+    (keeping _DEFAULT_TOP_K values unless top_k is set), as an exact
+    value_counts would cost what the estimate saves.
+
+    With top_k set, non-numeric columns keep only their top_k most frequent
+    values (Space-Saving sketches, kept in ``top_sketches``) instead of a
+    full value_counts, and their distinct counts are estimated.
+
+    With a ResultCache as cache, per-column results (profiles, distinct
+    counts, histograms, correlation rows) are stored under each column's
+    fingerprint, and only columns whose content changed are recomputed.
+
+    n_jobs is the number of threads a section may use for work of its own,
+    such as the correlation tiles under memory_limit.
+    """
+
+    def __init__(self, df: pd.DataFrame, quantile_error=None, memory_limit=None,
+                 distinct_precision=None, top_k=None, cache=None, n_jobs=1):
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("Input must be a pandas DataFrame")
+
+        self.quantile_error = quantile_error
+        self.memory_limit = memory_limit
+        self.distinct_precision = distinct_precision
+        self.distinct_sketches = {}
+        self.top_k = top_k
+        self.top_sketches = {}
+        self.quantile_sketches = {}
+        self.cache = cache
+        self.n_jobs = n_jobs
+
+        self._setup(
+            df,
+            n_rows=len(df),
+            dtypes=df.dtypes,
+            numeric_columns=df.select_dtypes(include="number").columns.tolist()
+        )
+
+    def _setup(self, df, n_rows, dtypes, numeric_columns):
+        self.df = df
+        self.n_rows = n_rows
+        self.columns = list(dtypes.index)
+        self.dtypes = dtypes
+        self.numeric_columns = list(numeric_columns)
+        self._numeric = set(self.numeric_columns)
+        self.categorical_columns = [
+            c for c in self.columns if c not in self._numeric
+        ]
+
+        self._profiles = {}
+        self._null_counts = None
+        self._numeric_table = None
+        self._results = {}
+        self._lock = threading.Lock()
+        self._numeric_lock = threading.Lock()
+        self._column_locks = {}
+        self._result_locks = {}
+
+    @classmethod
+    def from_profiles(cls, profiles, n_rows) -> "ProfileContext":
+        """
+        Builds a context from precomputed profiles (e.g. accumulated over
+        chunks) without holding the underlying data.
+        """
+        ctx = cls.__new__(cls)
+        ctx.quantile_error = None
+        ctx.memory_limit = None
+        ctx.distinct_precision = None
+        ctx.distinct_sketches = {}
+        ctx.top_k = None
+        ctx.top_sketches = {}
+        ctx.quantile_sketches = {}
+        ctx.cache = None
+        ctx.n_jobs = 1
+        ctx._setup(
+            None,
+            n_rows=n_rows,
+            dtypes=pd.Series({p.name: p.dtype for p in profiles}, dtype=object),
+            numeric_columns=[p.name for p in profiles if p.is_numeric]
+        )
+        ctx._profiles = {p.name: p for p in profiles}
+        ctx._null_counts = pd.Series(
+            {p.name: p.null_count for p in profiles}, dtype="int64"
+        )
+        return ctx
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"], state["_numeric_lock"]
+        del state["_column_locks"], state["_result_locks"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._numeric_lock = threading.Lock()
+        self._column_locks = {}
+        self._result_locks = {}
+
+    def _column_lock(self, col):
+        with self._lock:
+            return self._column_locks.setdefault(col, threading.Lock())
+
+    def cached(self, key, compute):
+        """
+        Returns the run-wide result stored under key (e.g. a correlation
+        matrix), calling compute() to produce it on first request.
+        """
+        if key not in self._results:
+            with self._lock:
+                lock = self._result_locks.setdefault(key, threading.Lock())
+            with lock:
+                if key not in self._results:
+                    self._results[key] = compute()
+        return self._results[key]
+
+    def fingerprint(self, col) -> str:
+        return self.cached(("fingerprint", col), lambda: column_fingerprint(self.df[col]))
+
+    def _column_key(self, col, kind, *extra) -> tuple:
+        # Options that change per-column results are part of the key
+        return (
+            kind, self.fingerprint(col),
+            self.quantile_error, self.distinct_precision, self.top_k
+        ) + extra
+
+    def reuse(self, col, kind, compute, *extra):
+        """
+        compute() for a column, loaded from or saved to the cache (when
+        set) under the column's fingerprint, kind and extra key parts.
+        """
+        if self.cache is None:
+            return compute()
+        return self.cache.cached(self._column_key(col, kind, *extra), compute)
+
+    @property
+    def null_counts(self) -> pd.Series:
+        if self._null_counts is None:
+            self._null_counts = self.df.isnull().sum()
+        return self._null_counts
+
+    def profile(self, col) -> ColumnProfile:
+        if col in self._profiles:
+            return self._profiles[col]
+
+        if col in self._numeric:
+            self._scan_numeric()
+            return self._profiles[col]
+
+        with self._column_lock(col):
+            if col not in self._profiles and self._sketch_categorical():
+                profile, self.top_sketches[col], self.distinct_sketches[col] = self.reuse(
+                    col, "profile", lambda: _scan_categorical_sketch(
+                        col, self.df[col], self.top_k or _DEFAULT_TOP_K,
+                        self.distinct_precision or 14
+                    )
+                )
+                self._profiles[col] = profile
+            elif col not in self._profiles:
+                self._profiles[col] = self.reuse(
+                    col, "profile", lambda: _scan_categorical(
+                        col, self.dtypes[col], *self.codes(col)
+                    )
+                )
+
+        return self._profiles[col]
+
+    def codes(self, col) -> tuple:
+        """
+        Factorized form of a non-numeric column, (int32 codes, uniques)
+        with -1 for missing values. Computed once per run and shared by
+        value counts and duplicate detection, so values are hashed once.
+        """
+        return self.cached(("codes", col), lambda: _factorize(self.df[col]))
+
+    def _sketch_categorical(self) -> bool:
+        if self.top_k is not None:
+            return True
+        return (
+            self.distinct_precision is not None
+            and self.n_rows > HyperLogLog(self.distinct_precision).exact_limit
+        )
+
+    def _scan_numeric(self):
+        with self._numeric_lock:
+            columns = [c for c in self.numeric_columns if c not in self._profiles]
+            if not columns:
+                return
+
+            if self.cache is not None:
+                for col in columns:
+                    stored = self.cache.get(self._column_key(col, "profile"))
+                    if stored is not None:
+                        self._profiles[col], sketch = stored
+                        if sketch is not None:
+                            self.quantile_sketches[col] = sketch
+                columns = [c for c in columns if c not in self._profiles]
+                if not columns:
+                    return
+
+            # Columns are independent, so only those not stored are scanned
+            profiles, sketches = _scan_numeric_block(
+                self.df[columns], self.quantile_error
+            )
+            if sketches is None:
+                sketches = [None] * len(columns)
+
+            for profile, sketch in zip(profiles, sketches):
+                self._profiles[profile.name] = profile
+                if sketch is not None:
+                    self.quantile_sketches[profile.name] = sketch
+                if self.cache is not None:
+                    self.cache.put(self._column_key(profile.name, "profile"), (profile, sketch))
+
+    def prepare(self) -> "ProfileContext":
+        """
+        Computes the profiles and distinct counts every section shares, so
+        that copies of the context sent to worker processes carry them
+        instead of each rescanning the data.
+        """
+        self.numeric_table()
+        self.categorical_profiles()
+        self.distinct_counts()
+        return self
+
+    def numeric_profiles(self):
+        return [self.profile(col) for col in self.numeric_columns]
+
+    def categorical_profiles(self):
+        return [self.profile(col) for col in self.categorical_columns]
+
+    def distinct_counts(self) -> pd.Series:
+        """
+        Number of distinct non-missing values per column.
+
+        Counts already known from a profile are reused; otherwise columns
+        are counted exactly, or, with distinct_precision set and more rows
+        than a HyperLogLog counter keeps exactly, estimated.
+        """
+        return self.cached("distinct_counts", self._count_distinct)
+
+    def _count_distinct(self) -> pd.Series:
+        counts = {}
+        for col in self.columns:
+            # Numeric profiles are only reused when already scanned: the
+            # moment and quantile scan costs far more than the count
+            profile = self._profiles.get(col)
+            if profile is None and col not in self._numeric:
+                profile = self.profile(col)
+
+            if profile is not None and profile.n_distinct is not None:
+                counts[col] = profile.n_distinct
+            elif profile is not None and not profile.is_numeric and profile.value_counts is not None:
+                counts[col] = profile.n_unique
+            else:
+                counts[col] = self.reuse(col, "distinct", lambda: self._count_column(col))
+
+        return pd.Series(counts, index=self.columns, dtype="int64")
+
+    def _count_column(self, col) -> int:
+        if self.distinct_precision is None:
+            return int(self.df[col].nunique())
+
+        sketch = HyperLogLog(self.distinct_precision)
+        if self.n_rows <= sketch.exact_limit:
+            return int(self.df[col].nunique())
+        self.distinct_sketches[col] = sketch.update(self.df[col])
+        return sketch.count()
+
+    def numeric_table(self) -> pd.DataFrame:
+        """
+        Per-column numeric statistics as one float table (a row per
+        numeric column), for vectorized consumers.
+        """
+        if self._numeric_table is None:
+            self._numeric_table = pd.DataFrame(
+                [
+                    [p.count, p.mean, p.std, p.min, p.q1, p.median, p.q3, p.max,
+                     p.skewness, p.kurtosis, p.outlier_count]
+                    for p in self.numeric_profiles()
+                ],
+                index=self.numeric_columns,
+                columns=["count", "mean", "std", "min", "25%", "50%", "75%",
+                         "max", "skewness", "kurtosis", "outlier_count"],
+                dtype=float
+            )
+        return self._numeric_table
+
+
+def _get_context(df, context=None, **options) -> ProfileContext:
+    if context is not None:
+        return context
+    return ProfileContext(df, **options)
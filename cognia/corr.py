@@ -1,50 +1,496 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from io import BytesIO
 import base64
 
+from .context import _get_context
+from .scheduler import _resolve_n_jobs
+
 
 # ---------------- Utility ----------------
 
-def _encode_plot():
+def _encode_plot(fig):
     buffer = BytesIO()
-    plt.savefig(buffer, format="png", bbox_inches="tight")
-    plt.close()
+    fig.savefig(buffer, format="png", bbox_inches="tight")
     return base64.b64encode(buffer.getvalue()).decode()
 
 # ---------------- Correlation computations ----------------
 
-def top_correlated_pairs(df, threshold=0.6, top_n=10):
-    corr = df.select_dtypes(include="number").corr().abs()
-    upper = corr.where(np.triu(np.ones(corr.shape), k=1).astype(bool))
-
-    pairs = (
-        upper.stack()
-        .reset_index()
-        .rename(columns={
-            "level_0": "Feature 1",
-            "level_1": "Feature 2",
-            0: "Correlation"
-        })
-        .sort_values("Correlation", ascending=False)
+def _select_top(values, positions, threshold, top_n):
+    """
+    Indices of the top_n values at or above threshold, strongest first and
+    ties ordered by position. A top_n of None keeps every candidate.
+    """
+    # Only values above the threshold compete; when there are more than
+    # top_n of them, partition first so only the winners get sorted
+    with np.errstate(invalid="ignore"):
+        candidates = np.flatnonzero(values >= threshold)
+    if top_n is not None and top_n > 0 and len(candidates) > top_n:
+        kth = len(candidates) - top_n
+        cutoff = np.partition(values[candidates], kth)[kth]
+        candidates = candidates[values[candidates] >= cutoff]
+
+    order = np.lexsort((positions[candidates], -values[candidates]))
+    return candidates[order][:top_n]
+
+
+def _pairs_frame(columns, positions, values) -> pd.DataFrame:
+    # Row labels are the pair's flat position in the p×p matrix
+    return pd.DataFrame(
+        {
+            "Feature 1": columns[positions // len(columns)],
+            "Feature 2": columns[positions % len(columns)],
+            "Correlation": values
+        },
+        index=positions
+    )
+
+
+def _top_pairs(corr: pd.DataFrame, threshold=0.6, top_n=10) -> pd.DataFrame:
+    rows, cols = np.triu_indices(len(corr.columns), k=1)
+    upper = np.abs(corr.to_numpy(dtype=np.float64)[rows, cols])
+    positions = rows * len(corr.columns) + cols
+
+    winners = _select_top(upper, positions, threshold, top_n)
+    return _pairs_frame(corr.columns, positions[winners], upper[winners])
+
+
+def top_correlated_pairs(df, threshold=0.6, top_n=10, context=None,
+                         method="pearson", memory_limit=None, n_jobs=None):
+    """
+    Numeric column pairs with the strongest absolute correlation.
+
+    With memory_limit (e.g. "2GB") the correlation is computed tile by
+    tile and the full matrix is never held, see blocked_correlation.
+    """
+    result = correlation_result(
+        df, context=context, method=method, memory_limit=memory_limit,
+        n_jobs=n_jobs, threshold=threshold, top_n=top_n
     )
+    return result.top_pairs(threshold=threshold, top_n=top_n)
+
+
+def _heatmap(corr: pd.DataFrame) -> str:
+    # Figure API instead of pyplot so the heatmap can render off the main thread
+    fig = Figure(figsize=(8, 6))
+    ax = fig.subplots()
+    image = ax.imshow(corr, cmap="coolwarm")
+    fig.colorbar(image, ax=ax)
+
+    ax.set_xticks(range(len(corr)))
+    ax.set_xticklabels(corr.columns, rotation=45, ha="right")
+    ax.set_yticks(range(len(corr)))
+    ax.set_yticklabels(corr.columns)
+    ax.set_title("Full Correlation Heatmap")
+
+    fig.tight_layout()
+    return _encode_plot(fig)
+
+
+def full_correlation_heatmap(df, context=None, method="pearson",
+                             memory_limit=None, n_jobs=None):
+    """
+    Heatmap of the numeric correlation matrix. With memory_limit the
+    matrix is computed tile by tile and averaged down to at most
+    _HEATMAP_CELLS cells per side.
+    """
+    result = correlation_result(
+        df, context=context, method=method, memory_limit=memory_limit, n_jobs=n_jobs
+    )
+    return result.heatmap()
+
+
+# ---------------- Shared result ----------------
+
+class CorrelationResult:
+    """
+    Correlation of a table's numeric columns, computed once and shared by
+    the top pairs and the heatmap.
+
+    Holds the dense matrix, or, when computed tile by tile, only the top
+    pairs selected with (threshold, top_n) and the downsampled heatmap
+    matrix; ``matrix`` is then None.
+    """
+
+    def __init__(self, method, matrix=None, pairs=None, heatmap_matrix=None,
+                 threshold=None, top_n=None):
+        self.method = method
+        self.matrix = matrix
+        self.pairs = pairs
+        self.heatmap_matrix = matrix if heatmap_matrix is None else heatmap_matrix
+        self.threshold = threshold
+        self.top_n = top_n
+
+    def top_pairs(self, threshold=0.6, top_n=10) -> pd.DataFrame:
+        if self.matrix is not None:
+            return _top_pairs(self.matrix, threshold=threshold, top_n=top_n)
+        if (threshold, top_n) != (self.threshold, self.top_n):
+            raise ValueError(
+                f"Top pairs were computed for threshold={self.threshold}, "
+                f"top_n={self.top_n}"
+            )
+        return self.pairs
+
+    def heatmap(self) -> str:
+        return _heatmap(self.heatmap_matrix)
+
+
+def correlation_result(df, context=None, method="pearson", memory_limit=None,
+                       n_jobs=None, threshold=0.6, top_n=10) -> CorrelationResult:
+    """
+    Returns the CorrelationResult for the numeric columns, cached on the
+    run context so the correlation is computed at most once per method.
+
+    threshold and top_n only matter with memory_limit, where the top pairs
+    are selected while the tiles are computed, on n_jobs threads (by
+    default the context's).
+    """
+    ctx = _get_context(df, context)
+    if memory_limit is None:
+        memory_limit = ctx.memory_limit
+    if n_jobs is None:
+        n_jobs = ctx.n_jobs
+
+    if memory_limit is None:
+        return ctx.cached(
+            ("correlation", method),
+            lambda: CorrelationResult(
+                method, matrix=_reused_correlation(df, ctx, method)
+            )
+        )
+
+    if method != "pearson":
+        raise ValueError("Tiled correlation only supports method='pearson'")
+
+    def compute():
+        blocked = blocked_correlation(
+            df, memory_limit, threshold=threshold, top_n=top_n,
+            n_jobs=n_jobs, context=ctx
+        )
+        return CorrelationResult(
+            method, pairs=blocked["top_pairs"], heatmap_matrix=blocked["heatmap"],
+            threshold=threshold, top_n=top_n
+        )
+
+    return ctx.cached(("correlation", method, threshold, top_n), compute)
+
+
+def _reused_correlation(df, ctx, method) -> pd.DataFrame:
+    """
+    Dense correlation matrix. With a result cache on the context, each
+    column's row is stored as {fingerprint: correlation} and only pairs
+    involving a changed or new column are computed.
+    """
+    columns = ctx.numeric_columns
+    if ctx.cache is None:
+        return df[columns].corr(method=method)
+
+    fingerprints = [ctx.fingerprint(col) for col in columns]
+    p = len(columns)
+    matrix = np.full((p, p), np.nan)
+    known = np.zeros((p, p), dtype=bool)
+    changed = np.ones(p, dtype=bool)
+
+    for i, col in enumerate(columns):
+        row = ctx.cache.get(ctx._column_key(col, "correlation", method))
+        if row is not None:
+            changed[i] = False
+            for j, other in enumerate(fingerprints):
+                if other in row:
+                    matrix[i, j] = row[other]
+                    known[i, j] = True
+
+    # A pair stored on either side is known; recomputing the rows of the
+    # changed columns covers the rest, bar pairs of unchanged columns
+    # stored at different times
+    stale = ~known.all(axis=1)
+    matrix = np.where(known, matrix, matrix.T)
+    unknown = ~(known | known.T)
+    unknown[changed] = False
+    unknown[:, changed] = False
+    changed |= unknown.any(axis=1)
+
+    if changed.sum() > p // 2:
+        # Most of the matrix is new anyway
+        matrix = df[columns].corr(method=method).to_numpy(copy=True)
+    else:
+        numeric = df[columns]
+        for i in np.flatnonzero(changed):
+            row = numeric.corrwith(numeric.iloc[:, i], method=method).to_numpy()
+            matrix[i, :] = row
+            matrix[:, i] = row
+
+    for i in np.flatnonzero(stale | changed):
+        row = dict(zip(fingerprints, matrix[i].tolist()))
+        ctx.cache.put(ctx._column_key(columns[i], "correlation", method), row)
+
+    return pd.DataFrame(matrix, index=columns, columns=columns)
+
+
+# ---------------- Blocked correlation ----------------
+
+_MEMORY_UNITS = {"B": 1, "KB": 2 ** 10, "MB": 2 ** 20, "GB": 2 ** 30, "TB": 2 ** 40}
+
+# Cells per side of the downsampled heatmap
+_HEATMAP_CELLS = 50
+
+
+def _parse_memory(limit) -> int:
+    """
+    Bytes for a memory limit given as a number or a string like "2GB".
+    """
+    if isinstance(limit, str):
+        match = re.fullmatch(r"([\d.]+)\s*([KMGT]?B)", limit.strip().upper())
+        if match is None:
+            raise ValueError(f"Invalid memory limit: {limit!r}")
+        limit = float(match.group(1)) * _MEMORY_UNITS[match.group(2)]
+    if limit <= 0:
+        raise ValueError("memory_limit must be positive")
+    return int(limit)
+
+
+def _tile_size(n_rows, n_cols, budget) -> int:
+    # A tile of b columns against b columns holds about eight b×b float64
+    # matrices and four n×b column slices
+    b = (np.sqrt((32 * n_rows) ** 2 + 256 * budget) - 32 * n_rows) / 128
+    return int(min(n_cols, max(1, b)))
+
+
+def _standardize(ctx):
+    """
+    Numeric block centred and scaled once by the profiled mean and std,
+    with missing values zeroed. The presence mask is None when nothing
+    is missing.
+    """
+    table = ctx.numeric_table()
+    values = ctx.df[ctx.numeric_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    scale = table["std"].to_numpy()
+    scale = np.where(scale > 0, scale, 1.0)
+    z = (values - table["mean"].to_numpy()) / scale
+
+    present = ~np.isnan(z)
+    if present.all():
+        return z, None
+
+    z[~present] = 0.0
+    return z, present.astype(np.float64)
+
+
+def _correlation_tile(z, mask, rows, cols) -> np.ndarray:
+    """
+    Pairwise-complete Pearson correlation of the columns in rows against
+    the columns in cols (two slices of the standardized block).
+    """
+    a, b = z[:, rows], z[:, cols]
+
+    if mask is None:
+        n = len(z)
+        sx, sy = a.sum(axis=0)[:, None], b.sum(axis=0)[None, :]
+        sxx, syy = (a * a).sum(axis=0)[:, None], (b * b).sum(axis=0)[None, :]
+    else:
+        ma, mb = mask[:, rows], mask[:, cols]
+        # [i, j] entries only cover rows where both columns are present
+        n = ma.T @ mb
+        sx, sy = a.T @ mb, ma.T @ b
+        sxx, syy = (a * a).T @ mb, ma.T @ (b * b)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = a.T @ b - sx * sy / n
+        var_x = sxx - sx ** 2 / n
+        var_y = syy - sy ** 2 / n
+        corr = cov / np.sqrt(var_x * var_y)
+
+        # Columns that are constant (up to round-off) over the shared rows
+        # have no defined correlation
+        flat = (var_x <= 1e-12 * sxx) | (var_y <= 1e-12 * syy) | (n < 2)
+
+    corr = np.clip(np.where(flat, np.nan, corr), -1.0, 1.0)
+
+    # A column correlates perfectly with itself
+    same = np.arange(rows.start, rows.stop)[:, None] == np.arange(cols.start, cols.stop)[None, :]
+    corr[same & ~np.isnan(corr)] = 1.0
+    return corr
+
+
+def _reduce_tile(z, mask, rows, cols, threshold, top_n, cells, n_cells):
+    """
+    Computes one tile and reduces it to its top pair candidates and its
+    contribution to the downsampled heatmap.
+    """
+    corr = _correlation_tile(z, mask, rows, cols)
+    p = z.shape[1]
+
+    i = np.arange(rows.start, rows.stop)[:, None]
+    j = np.arange(cols.start, cols.stop)[None, :]
+    upper = i < j
+    values = np.abs(corr[upper])
+    positions = (i * p + j)[upper]
+
+    # Negative top_n drops from the end, so every candidate must be kept
+    keep = _select_top(values, positions, threshold, top_n if top_n >= 0 else None)
+
+    # Indicator matrices sum the tile into heatmap cells
+    to_rows = np.zeros((len(i), n_cells))
+    to_rows[np.arange(len(i)), cells[rows]] = 1.0
+    to_cols = np.zeros((j.shape[1], n_cells))
+    to_cols[np.arange(j.shape[1]), cells[cols]] = 1.0
+
+    finite = np.isfinite(corr)
+    sums = to_rows.T @ np.where(finite, corr, 0.0) @ to_cols
+    counts = to_rows.T @ finite.astype(np.float64) @ to_cols
+
+    return values[keep], positions[keep], sums, counts
+
+
+def blocked_correlation(df, memory_limit="2GB", threshold=0.6, top_n=10,
+                        n_jobs=1, context=None) -> dict:
+    """
+    Pairwise-complete Pearson correlation of every numeric column pair,
+    computed tile by tile so the p×p matrix is never held in memory.
+
+    Columns are standardized once; each tile is reduced as soon as it is
+    computed into top pair candidates and into a heatmap averaged down to
+    at most _HEATMAP_CELLS cells per side. memory_limit (bytes or a string
+    such as "2GB") caps the tiles' working memory across all n_jobs
+    threads; the standardized data is held once on top of it.
+
+    Returns a dict with "top_pairs" (as top_correlated_pairs) and
+    "heatmap" (the downsampled matrix as a DataFrame).
+    """
+    ctx = _get_context(df, context)
+    columns = pd.Index(ctx.numeric_columns)
+    p = len(columns)
+
+    z, mask = _standardize(ctx)
+    n_jobs = _resolve_n_jobs(n_jobs)
+    size = _tile_size(len(z), p, _parse_memory(memory_limit) // n_jobs)
+
+    # Contiguous groups of columns share a heatmap cell
+    n_cells = min(p, _HEATMAP_CELLS)
+    cells = np.arange(p) * n_cells // max(p, 1)
+
+    blocks = [slice(start, min(start + size, p)) for start in range(0, p, size)]
+    tiles = [(rows, cols) for k, rows in enumerate(blocks) for cols in blocks[k:]]
+
+    def reduce(tile):
+        return _reduce_tile(z, mask, *tile, threshold, top_n, cells, n_cells)
+
+    values, positions = [np.empty(0)], [np.empty(0, dtype=np.int64)]
+    sums = np.zeros((n_cells, n_cells))
+    counts = np.zeros((n_cells, n_cells))
+
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        reduced = executor.map(reduce, tiles) if n_jobs > 1 else map(reduce, tiles)
+
+        # Tiles are folded in submission order so results are deterministic
+        for (rows, cols), (v, pos, s, c) in zip(tiles, reduced):
+            values.append(v)
+            positions.append(pos)
+            sums += s
+            counts += c
+            if rows != cols:
+                # The mirrored tile below the diagonal
+                sums += s.T
+                counts += c.T
+
+    values, positions = np.concatenate(values), np.concatenate(positions)
+    winners = _select_top(values, positions, threshold, top_n)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        heatmap = sums / counts
+
+    if n_cells == p:
+        labels = columns
+    else:
+        labels = [
+            f"{columns[group[0]]}..{columns[group[-1]]}" if len(group) > 1
+            else str(columns[group[0]])
+            for group in np.split(np.arange(p), np.flatnonzero(np.diff(cells)) + 1)
+        ]
+
+    return {
+        "top_pairs": _pairs_frame(columns, positions[winners], values[winners]),
+        "heatmap": pd.DataFrame(heatmap, index=labels, columns=labels)
+    }
+
+
+# ---------------- Streaming correlation ----------------
+
+class CorrelationState:
+    """
+    Mergeable co-moment sums for pairwise-complete Pearson correlation.
+
+    Values are shifted by a per-column reference (the first chunk's mean)
+    before accumulation to limit cancellation in the raw sums.
+    """
+
+    def __init__(self, columns):
+        p = len(columns)
+        self.columns = list(columns)
+        self.shift = None
+        self.n = np.zeros((p, p))
+        self.sx = np.zeros((p, p))
+        self.sxx = np.zeros((p, p))
+        self.sxy = np.zeros((p, p))
+
+    def update(self, values) -> "CorrelationState":
+        values = np.asarray(values, dtype=np.float64)
+        if self.shift is None:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                counts = (~np.isnan(values)).sum(axis=0)
+                shift = np.nansum(values, axis=0) / counts
+            self.shift = np.where(counts > 0, shift, 0.0)
+
+        x = values - self.shift
+        present = ~np.isnan(x)
+        x = np.where(present, x, 0.0)
+        mask = present.astype(np.float64)
 
-    return pairs[pairs["Correlation"] >= threshold].head(top_n)
+        # [i, j] entries only cover rows where both columns are present
+        self.n += mask.T @ mask
+        self.sx += x.T @ mask
+        self.sxx += (x * x).T @ mask
+        self.sxy += x.T @ x
+        return self
 
+    def merge(self, other: "CorrelationState") -> "CorrelationState":
+        if other.columns != self.columns:
+            raise ValueError("Correlation states cover different columns")
+        if other.shift is None:
+            return self
+        if self.shift is None:
+            return other
 
+        # Re-express the other side's sums around this side's shift
+        d = other.shift - self.shift
+        d_i, d_j = d[:, None], d[None, :]
 
-def full_correlation_heatmap(df):
-    corr = df.select_dtypes(include="number").corr()
+        merged = CorrelationState(self.columns)
+        merged.shift = self.shift
+        merged.n = self.n + other.n
+        merged.sx = self.sx + other.sx + d_i * other.n
+        merged.sxx = self.sxx + other.sxx + 2 * d_i * other.sx + d_i ** 2 * other.n
+        merged.sxy = (
+            self.sxy + other.sxy
+            + d_j * other.sx + d_i * other.sx.T + d_i * d_j * other.n
+        )
+        return merged
 
-    plt.figure(figsize=(8, 6))
-    plt.imshow(corr, cmap="coolwarm")
-    plt.colorbar()
+    def matrix(self) -> pd.DataFrame:
+        n, sx, sxx = self.n, self.sx, self.sxx
 
-    plt.xticks(range(len(corr)), corr.columns, rotation=45, ha="right")
-    plt.yticks(range(len(corr)), corr.columns)
-    plt.title("Full Correlation Heatmap")
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cov = self.sxy - sx * sx.T / n
+            var_x = sxx - sx ** 2 / n
+            var_y = sxx.T - sx.T ** 2 / n
+            corr = cov / np.sqrt(var_x * var_y)
 
-    plt.tight_layout()
-    return _encode_plot()
+        corr = np.clip(corr, -1.0, 1.0)
+        corr[n < 2] = np.nan
 
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+
+from .context import _get_context
+
+
+# ---------------- Row hashing ----------------
+
+_MULTIPLIER = np.uint64(1000003)
+
+
+def _hashable(values):
+    # -0.0 and 0.0 are equal but differ in their bits, so they would hash apart
+    if pd.api.types.is_float_dtype(values):
+        return values + 0.0
+    return values
+
+
+def row_hashes(df: pd.DataFrame, context=None) -> np.ndarray:
+    """
+    One uint64 hash per row over all columns (the index is ignored).
+
+    With a context, non-numeric columns are hashed through their cached
+    factorize codes rather than their values.
+    """
+    if context is None:
+        df = df.apply(_hashable) if len(df.columns) else df
+        return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+    hashes = np.full(len(df), 0x345678, dtype=np.uint64)
+    for j, col in enumerate(context.columns):
+        if col in context.numeric_columns:
+            column = pd.util.hash_pandas_object(_hashable(df.iloc[:, j]), index=False).to_numpy()
+        else:
+            column = pd.util.hash_array(context.codes(col)[0])
+        hashes ^= column
+        hashes *= _MULTIPLIER + np.uint64(2 * j)
+    return hashes
+
+
+def _same_rows(ctx, rows, firsts) -> np.ndarray:
+    """
+    Whether each row in rows equals the row at the same position in
+    firsts, with missing values equal to each other as in duplicated().
+    Non-numeric columns are compared by their codes.
+    """
+    same = np.ones(len(rows), dtype=bool)
+    for j, col in enumerate(ctx.columns):
+        if col in ctx.numeric_columns:
+            values = ctx.df.iloc[:, j]
+            a = values.iloc[rows].reset_index(drop=True)
+            b = values.iloc[firsts].reset_index(drop=True)
+            equal = (a == b).fillna(False) | (a.isna() & b.isna())
+            same &= equal.to_numpy(dtype=bool)
+        else:
+            codes = ctx.codes(col)[0]
+            same &= codes[rows] == codes[firsts]
+    return same
+
+
+# ---------------- Duplicate detection ----------------
+
+def duplicate_summary(df, context=None, verify=True) -> dict:
+    """
+    Counts duplicate rows from a single pass of row hashing.
+
+    Rows are grouped by hash; with verify=True the rows of each group are
+    compared with the group's first row and, should two different rows
+    share a hash, the count falls back to an exact duplicated() check.
+
+    Returns the duplicate count and percent (as df.duplicated()) and the
+    sizes of the groups of identical rows, largest first.
+    """
+    if context is None and not isinstance(df, pd.DataFrame):
+        raise TypeError("Input must be a pandas DataFrame")
+
+    ctx = _get_context(df, context)
+    return ctx.cached(("duplicates", verify), lambda: _duplicate_summary(ctx, verify))
+
+
+def _duplicate_summary(ctx, verify) -> dict:
+    df = ctx.df
+    n_rows = len(df)
+    if n_rows == 0:
+        return {
+            "duplicate_records": 0,
+            "duplicate_percent": np.nan,
+            "group_sizes": np.empty(0, dtype=np.int64)
+        }
+
+    hashes = row_hashes(df, context=ctx)
+
+    order = np.argsort(hashes, kind="stable")
+    sorted_hashes = hashes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_hashes[1:] != sorted_hashes[:-1]])
+    sizes = np.diff(np.r_[starts, n_rows])
+
+    if verify and (sizes > 1).any():
+        # Compare every repeated row with the first row of its hash group
+        group = np.repeat(np.arange(len(starts)), sizes)
+        repeated = np.flatnonzero(np.r_[False, sorted_hashes[1:] == sorted_hashes[:-1]])
+        firsts = order[starts[group[repeated]]]
+
+        if not _same_rows(ctx, order[repeated], firsts).all():
+            # A hash collision: group on exact per-column codes instead
+            codes = np.column_stack([
+                pd.factorize(df.iloc[:, j])[0] if col in ctx.numeric_columns
+                else ctx.codes(col)[0]
+                for j, col in enumerate(ctx.columns)
+            ])
+            sizes = np.unique(codes, axis=0, return_counts=True)[1]
+
+    duplicates = int(n_rows - len(sizes))
+    groups = np.sort(sizes[sizes > 1])[::-1]
+
+    return {
+        "duplicate_records": duplicates,
+        "duplicate_percent": round(duplicates / n_rows * 100, 2),
+        "group_sizes": groups
+    }
@@ -0,0 +1,117 @@
+import json
+import os
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+
+
+# ---------------- Tables ----------------
+
+def eda_tables(result: Mapping) -> dict:
+    """
+    The sections of a quick_eda result (or EDAResult) as flat tables, one
+    DataFrame per section, with rendered images left out. Column labels
+    that were DataFrame indexes become a "column" field.
+    """
+    tables = {}
+
+    if "overview" in result:
+        overview = result["overview"]
+        summary = {"rows": [overview["rows"]], "columns": [overview["columns"]]}
+        if "data_quality" in result:
+            for key, value in result["data_quality"].items():
+                summary[key] = [value]
+        tables["summary"] = pd.DataFrame(summary)
+        tables["column_overview"] = overview["column_overview"]
+
+    for name in ("missing", "statistics"):
+        if name in result:
+            tables[name] = result[name].rename_axis("column").reset_index()
+
+    for name in ("outliers", "interpretation"):
+        if name in result:
+            tables[name] = result[name].reset_index(drop=True)
+
+    if "alerts" in result:
+        tables["alerts"] = pd.DataFrame({"message": result["alerts"]}, dtype=object)
+
+    if "correlation" in result:
+        tables["correlation"] = result["correlation"]["top_pairs"].reset_index(drop=True)
+
+    return tables
+
+
+# ---------------- Parquet ----------------
+
+# Fields holding DataFrame column labels, which may mix types (e.g. 0 and "b")
+_LABEL_FIELDS = ["column", "column_name", "Feature 1", "Feature 2"]
+
+
+def export_parquet(result: Mapping, directory, profile_id=None):
+    """
+    Writes each section table to directory/<section>.parquet. With a
+    profile_id every row is tagged with it, so the files of many profiles
+    can be loaded into the same warehouse tables. Needs a Parquet engine
+    (pyarrow or fastparquet).
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    for name, table in eda_tables(result).items():
+        table = table.rename(columns=str)
+        for field in _LABEL_FIELDS:
+            if field in table:
+                table[field] = table[field].map(str)
+        if profile_id is not None:
+            table.insert(0, "profile_id", profile_id)
+        table.to_parquet(os.path.join(directory, f"{name}.parquet"), index=False)
+
+
+# ---------------- JSON ----------------
+
+def _scalar(value):
+    # JSON-ready form of a single cell; missing and infinite values become null
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or value is pd.NaT or value is pd.NA:
+        return None
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    if isinstance(value, (pd.Timestamp, pd.Timedelta)):
+        return value.isoformat()
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _write_records(f, table: pd.DataFrame):
+    # One row at a time, so no JSON text for the whole table is built
+    columns = [str(c) for c in table.columns]
+    f.write("[")
+    for i, row in enumerate(table.itertuples(index=False, name=None)):
+        if i:
+            f.write(",")
+        f.write(json.dumps(dict(zip(columns, map(_scalar, row))), allow_nan=False))
+    f.write("]")
+
+
+def export_json(result: Mapping, file, profile_id=None):
+    """
+    Streams the section tables as one JSON object, each section a list of
+    row objects, to a path or an open text file. Images are skipped and
+    missing and infinite values are written as null.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "w", encoding="utf-8") as f:
+            return export_json(result, f, profile_id=profile_id)
+
+    file.write("{")
+    if profile_id is not None:
+        file.write(f'"profile_id": {json.dumps(_scalar(profile_id))}, ')
+
+    for i, (name, table) in enumerate(eda_tables(result).items()):
+        if i:
+            file.write(", ")
+        file.write(f"{json.dumps(name)}: ")
+        _write_records(file, table)
+    file.write("}")
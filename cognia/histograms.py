@@ -0,0 +1,158 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from .context import _get_context
+
+
+Histogram = namedtuple("Histogram", ["edges", "counts"])
+
+# Upper bound on Freedman–Diaconis bins, heavy tails can ask for thousands
+_MAX_BINS = 256
+
+# Values binned per step; keeps the temporaries of a block cache resident
+_BLOCK_CELLS = 2 ** 16
+
+
+# ---------------- Bin layout ----------------
+
+def _bin_counts(bins, table, integer) -> np.ndarray:
+    """
+    Number of bins per column: fixed, or "fd" (Freedman–Diaconis) from
+    the profiled count, IQR and range.
+    """
+    if isinstance(bins, str):
+        if bins != "fd":
+            raise ValueError("bins must be an integer or 'fd'")
+
+        count = table["count"].to_numpy()
+        span = table["max"].to_numpy() - table["min"].to_numpy()
+        iqr = table["75%"].to_numpy() - table["25%"].to_numpy()
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            width = 2.0 * iqr * count ** (-1.0 / 3.0)
+            # Integer data never gets bins narrower than one
+            width = np.where(integer & (width < 1), 1.0, width)
+            n_bins = np.where(width > 0, np.ceil(span / width), 1)
+
+        return np.clip(np.nan_to_num(n_bins, nan=1), 1, _MAX_BINS).astype(np.intp)
+
+    if int(bins) < 1:
+        raise ValueError("bins must be positive")
+    return np.full(len(table), int(bins), dtype=np.intp)
+
+
+def _edges(lo, hi, n_bins) -> np.ndarray:
+    # Same edges as np.histogram, including its widening of constant data
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    return np.linspace(lo, hi, n_bins + 1)
+
+
+# ---------------- Computation ----------------
+
+def compute_histograms(df, bins=30, context=None) -> dict:
+    """
+    Histograms of every numeric column, binned in one vectorized pass.
+
+    Ranges come from the profiled min/max; bins is a fixed number of bins
+    or "fd" for Freedman–Diaconis widths (from the profiled IQR, at most
+    _MAX_BINS). Returns {column: Histogram(edges, counts)} with counts as
+    compact int arrays, matching np.histogram bin for bin. Empty columns
+    are left out.
+    """
+    if context is None and not isinstance(df, pd.DataFrame):
+        raise TypeError("Input must be a pandas DataFrame")
+
+    ctx = _get_context(df, context)
+    return ctx.cached(("histograms", bins), lambda: _reused_histograms(ctx, bins))
+
+
+def _reused_histograms(ctx, bins) -> dict:
+    # With a result cache only columns without a stored histogram are binned
+    if ctx.cache is None:
+        return _compute_histograms(ctx, bins)
+
+    table = ctx.numeric_table()
+    columns = table.index[table["count"] > 0]
+    keys = {col: ctx._column_key(col, "histogram", bins) for col in columns}
+    result = {col: ctx.cache.get(key) for col, key in keys.items()}
+
+    todo = [col for col, hist in result.items() if hist is None]
+    if todo:
+        for col, hist in _compute_histograms(ctx, bins, todo).items():
+            result[col] = hist
+            ctx.cache.put(keys[col], hist)
+
+    return {col: result[col] for col in columns if result[col] is not None}
+
+
+def _compute_histograms(ctx, bins, columns=None) -> dict:
+    table = ctx.numeric_table()
+    if columns is not None:
+        table = table.loc[columns]
+    table = table[table["count"] > 0]
+    columns = table.index.tolist()
+
+    lo, hi = table["min"].to_numpy(), table["max"].to_numpy()
+    integer = np.array([
+        pd.api.types.is_integer_dtype(ctx.dtypes[col]) for col in columns
+    ], dtype=bool)
+    n_bins = _bin_counts(bins, table, integer)
+    dtype = np.int32 if ctx.n_rows < 2 ** 31 else np.int64
+
+    # Infinite values give no finite range; those columns are binned
+    # alone over their finite values
+    finite = np.isfinite(lo) & np.isfinite(hi)
+    result = {}
+
+    for col in np.array(columns, dtype=object)[~finite]:
+        values = ctx.df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values[np.isfinite(values)]
+        counts, edges = np.histogram(values, bins=bins)
+        if isinstance(bins, str) and len(counts) > _MAX_BINS:
+            counts, edges = np.histogram(values, bins=_MAX_BINS)
+        result[col] = Histogram(edges, counts.astype(dtype))
+
+    columns = [c for c, keep in zip(columns, finite) if keep]
+    lo, hi, n_bins = lo[finite], hi[finite], n_bins[finite]
+
+    # Edges and counts of all columns are laid out back to back
+    edges = [_edges(a, b, n) for a, b, n in zip(lo, hi, n_bins)]
+    flat_edges = np.concatenate(edges) if edges else np.empty(0)
+    edge_start = np.concatenate([[0], np.cumsum(n_bins + 1)[:-1]]).astype(np.intp)
+    count_start = np.concatenate([[0], np.cumsum(n_bins)[:-1]]).astype(np.intp)
+    first = np.array([e[0] for e in edges])
+    span = np.array([e[-1] - e[0] for e in edges])
+
+    counts = np.zeros(int(n_bins.sum()), dtype=np.int64)
+    values = ctx.df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+    has_missing = bool((table.loc[columns, "count"] < ctx.n_rows).any())
+    block_rows = max(1, _BLOCK_CELLS // max(len(columns), 1))
+
+    for start in range(0, len(values), block_rows):
+        x = values[start:start + block_rows]
+
+        # Bin index as np.histogram computes it, corrected by one bin
+        # where round-off puts a value on the wrong side of an edge
+        with np.errstate(invalid="ignore"):
+            idx = (x - first) / span * n_bins
+            if has_missing:
+                valid = ~np.isnan(x)
+                idx[~valid] = 0
+            idx = idx.astype(np.intp)
+            np.minimum(idx, n_bins - 1, out=idx)
+            idx -= x < flat_edges[edge_start + idx]
+            idx += (x >= flat_edges[edge_start + idx + 1]) & (idx != n_bins - 1)
+
+        idx += count_start
+        counts += np.bincount(idx[valid] if has_missing else idx.ravel(), minlength=len(counts))
+
+    for j, col in enumerate(columns):
+        result[col] = Histogram(
+            edges[j], counts[count_start[j]:count_start[j] + n_bins[j]].astype(dtype)
+        )
+
+    # Keep the numeric column order
+    return {col: result[col] for col in table.index if col in result}
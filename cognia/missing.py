@@ -1,15 +1,19 @@
 import pandas as pd
 
-def missing_report(df) -> pd.DataFrame:
+from .context import _get_context
+
+def missing_report(df, context=None) -> pd.DataFrame:
     """
     Returns missing value count and percentage for each column.
     """
     
-    if not isinstance(df, pd.DataFrame):
+    if context is None and not isinstance(df, pd.DataFrame):
         raise TypeError("Input must be a pandas DataFrame")
 
-    total = df.isnull().sum()
-    percent = (total / len(df)) * 100
+    ctx = _get_context(df, context)
+
+    total = ctx.null_counts
+    percent = (total / ctx.n_rows) * 100
 
     report = pd.DataFrame({
         "missing_count": total,
@@ -17,4 +21,3 @@ def missing_report(df) -> pd.DataFrame:
     })
 
     return report.sort_values(by="missing_percent", ascending=False)
-
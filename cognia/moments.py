@@ -0,0 +1,137 @@
+from collections import namedtuple
+
+import numpy as np
+
+
+# Rows per block: keeps the temporaries of the moment kernel cache friendly
+# and bounded regardless of the table length.
+_BLOCK_ROWS = 65536
+
+Moments = namedtuple("Moments", ["count", "mean", "m2", "m3", "m4", "min", "max"])
+
+
+# ---------------- Kernel ----------------
+
+def _block_moments(values: np.ndarray) -> Moments:
+    """
+    Count, mean, central moment sums and extrema of each column of a 2D
+    float block, ignoring NaN.
+    """
+    mask = np.isnan(values)
+    count = (~mask).sum(axis=0).astype(np.float64)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(mask, 0.0, values).sum(axis=0) / count
+        delta = np.where(mask, 0.0, values - mean)
+
+    delta2 = delta * delta
+    m2 = delta2.sum(axis=0)
+    m3 = (delta2 * delta).sum(axis=0)
+    m4 = (delta2 * delta2).sum(axis=0)
+
+    empty = count == 0
+    mean[empty] = 0.0
+    lo = np.fmin.reduce(values, axis=0, initial=np.inf)
+    hi = np.fmax.reduce(values, axis=0, initial=-np.inf)
+
+    return Moments(count, mean, m2, m3, m4, lo, hi)
+
+
+def _merge_moments(a: Moments, b: Moments) -> Moments:
+    """
+    Combines the moments of two disjoint row sets (Pébay's update formulas).
+    """
+    n = a.count + b.count
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        delta = b.mean - a.mean
+        na_nb = a.count * b.count
+
+        mean = a.mean + delta * b.count / n
+        m2 = a.m2 + b.m2 + delta ** 2 * na_nb / n
+        m3 = (
+            a.m3 + b.m3
+            + delta ** 3 * na_nb * (a.count - b.count) / n ** 2
+            + 3 * delta * (a.count * b.m2 - b.count * a.m2) / n
+        )
+        m4 = (
+            a.m4 + b.m4
+            + delta ** 4 * na_nb * (a.count ** 2 - na_nb + b.count ** 2) / n ** 3
+            + 6 * delta ** 2 * (a.count ** 2 * b.m2 + b.count ** 2 * a.m2) / n ** 2
+            + 4 * delta * (a.count * b.m3 - b.count * a.m3) / n
+        )
+
+    # Either side may be empty for some columns
+    merged = [mean, m2, m3, m4]
+    for i, (left, right) in enumerate(zip(a[1:5], b[1:5])):
+        merged[i] = np.where(a.count == 0, right, np.where(b.count == 0, left, merged[i]))
+
+    return Moments(
+        n, *merged, np.fmin(a.min, b.min), np.fmax(a.max, b.max)
+    )
+
+
+def moment_kernel(values: np.ndarray, block_rows=_BLOCK_ROWS) -> Moments:
+    """
+    Computes per-column moments of a 2D float array in a single pass,
+    block by block, ignoring NaN.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        values = values[:, None]
+
+    moments = _block_moments(values[:block_rows])
+    for start in range(block_rows, values.shape[0], block_rows):
+        moments = _merge_moments(moments, _block_moments(values[start:start + block_rows]))
+
+    return moments
+
+
+# ---------------- Derived statistics ----------------
+
+def _zero_out_fperr(arg, tol):
+    return np.where(np.abs(arg) < tol, 0.0, arg)
+
+
+def finalize_moments(moments: Moments) -> dict:
+    """
+    Turns accumulated moments into count, mean, std, min, max, skewness
+    and kurtosis arrays, matching pandas' sample (bias-corrected) estimators.
+    """
+    count, mean, m2, m3, m4, lo, hi = moments
+    empty = count == 0
+
+    # Constant columns have exactly zero spread, whatever round-off the
+    # block merges accumulated; otherwise use pandas' round-off tolerance
+    flat = lo == hi
+    m2, m3, m4 = (np.where(flat, 0.0, m) for m in (m2, m3, m4))
+    max_abs = np.fmax(np.abs(lo), np.abs(hi))
+    eps = np.finfo(np.float64).eps
+
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        m2 = _zero_out_fperr(m2, (eps * max_abs) ** 2 * count)
+        m3 = _zero_out_fperr(m3, (eps * max_abs) ** 3 * count)
+        m4 = _zero_out_fperr(m4, (eps * max_abs) ** 4 * count)
+
+        std = np.sqrt(m2 / (count - 1))
+        std[count < 2] = np.nan
+
+        skewness = (count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2 ** 1.5)
+        skewness = np.where(m2 == 0, 0.0, skewness)
+        skewness[count < 3] = np.nan
+
+        adj = 3 * (count - 1) ** 2 / ((count - 2) * (count - 3))
+        numerator = count * (count + 1) * (count - 1) * m4
+        denominator = (count - 2) * (count - 3) * m2 ** 2
+        kurtosis = np.where(denominator == 0, 0.0, numerator / denominator - adj)
+        kurtosis[count < 4] = np.nan
+
+    return {
+        "count": count,
+        "mean": np.where(empty, np.nan, mean),
+        "std": std,
+        "min": np.where(empty, np.nan, lo),
+        "max": np.where(empty, np.nan, hi),
+        "skewness": skewness,
+        "kurtosis": kurtosis,
+    }
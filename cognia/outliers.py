@@ -1,39 +1,26 @@
+import numpy as np
 import pandas as pd
 
-def outlier_detect(df: pd.DataFrame) -> pd.DataFrame:
+from .context import _get_context
+
+def outlier_detect(df: pd.DataFrame, context=None, quantile_error=None) -> pd.DataFrame:
     """
     Detects outliers using the IQR (Tukey) method for numeric columns.
+
+    quantile_error computes the Q1/Q3 fences from approximate quantiles
+    with that rank error (e.g. 0.005).
     """
-    if not isinstance(df, pd.DataFrame):
+    if context is None and not isinstance(df, pd.DataFrame):
         raise TypeError("Input must be a pandas DataFrame")
-        
-    numeric_df = df.select_dtypes(include="number")
-    rows = []
-
-    for col in numeric_df.columns:
-        series = numeric_df[col].dropna()
-
-        if series.empty:
-            continue
-
-        Q1 = series.quantile(0.25)
-        Q3 = series.quantile(0.75)
-        IQR = Q3 - Q1
-
-        # Handle constant columns
-        if IQR == 0:
-            outlier_count = 0
-        else:
-            lower = Q1 - 1.5 * IQR
-            upper = Q3 + 1.5 * IQR
-            outlier_count = ((series < lower) | (series > upper)).sum()
-
-        rows.append({
-            "column": col,
-            "outlier_count": int(outlier_count),
-            "outlier_percent": round((outlier_count / len(series)) * 100, 2)
-        })
 
-    return pd.DataFrame(rows)
+    ctx = _get_context(df, context, quantile_error=quantile_error)
+    table = ctx.numeric_table()
+    table = table[table["count"] > 0]
 
+    counts = table["outlier_count"].to_numpy()
 
+    return pd.DataFrame({
+        "column": table.index,
+        "outlier_count": counts.astype(int),
+        "outlier_percent": np.round(counts / table["count"].to_numpy() * 100, 2)
+    }) if len(table) else pd.DataFrame()
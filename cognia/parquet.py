@@ -0,0 +1,118 @@
+import numpy as np
+
+
+def _pyarrow():
+    # pyarrow is optional: only needed to read Parquet
+    try:
+        import pyarrow
+        import pyarrow.dataset
+    except ImportError as e:
+        raise ImportError("Reading Parquet requires pyarrow (pip install pyarrow)") from e
+    return pyarrow
+
+
+# ---------------- Footer statistics ----------------
+
+def footer_statistics(dataset, columns) -> dict:
+    """
+    Per-column totals from the Parquet footers, without reading any data:
+    {"n_rows": int, "null_counts": {col: int}, "ranges": {col: (min, max)}}.
+
+    A column only gets a null count (or range) when every row group
+    records one; partition columns have neither.
+    """
+    pa = _pyarrow()
+    schema = dataset.schema
+    numeric = {
+        col for col in columns
+        if pa.types.is_integer(schema.field(col).type) or pa.types.is_floating(schema.field(col).type)
+    }
+
+    n_rows = 0
+    nulls = {col: 0 for col in columns}
+    lows, highs = {}, {}
+    unknown_nulls, unknown_ranges = set(), set()
+
+    for fragment in dataset.get_fragments():
+        metadata = fragment.metadata
+        n_rows += metadata.num_rows
+
+        for g in range(metadata.num_row_groups):
+            group = metadata.row_group(g)
+            seen = set()
+
+            for c in range(group.num_columns):
+                chunk = group.column(c)
+                col = chunk.path_in_schema
+                if col not in nulls:
+                    continue
+                seen.add(col)
+
+                stats = chunk.statistics
+                if stats is None or not stats.has_null_count:
+                    unknown_nulls.add(col)
+                    unknown_ranges.add(col)
+                    continue
+                nulls[col] += stats.null_count
+
+                if col not in numeric or stats.null_count == group.num_rows:
+                    continue
+                if not stats.has_min_max:
+                    unknown_ranges.add(col)
+                    continue
+                lows[col] = min(lows.get(col, np.inf), stats.min)
+                highs[col] = max(highs.get(col, -np.inf), stats.max)
+
+            # Columns not stored in the file, e.g. partition keys
+            unknown_nulls.update(set(nulls) - seen)
+            unknown_ranges.update(set(nulls) - seen)
+
+    return {
+        "n_rows": n_rows,
+        "null_counts": {col: n for col, n in nulls.items() if col not in unknown_nulls},
+        "ranges": {
+            col: (lows[col], highs[col]) for col in lows
+            if col not in unknown_ranges and np.isfinite([lows[col], highs[col]]).all()
+        }
+    }
+
+
+# ---------------- Batches ----------------
+
+def parquet_batches(path, columns=None, batch_size=100_000):
+    """
+    Opens a Parquet file or (hive-partitioned) directory and returns the
+    columns read, the footer statistics and an iterator of DataFrame
+    batches, one record batch at a time.
+
+    Only the requested columns are read; columns whose footers show them
+    entirely missing are not read at all but filled with nulls.
+    """
+    pa = _pyarrow()
+    dataset = pa.dataset.dataset(path, format="parquet", partitioning="hive")
+
+    names = dataset.schema.names
+    if columns is None:
+        columns = names
+    else:
+        columns = list(columns)
+        missing = [col for col in columns if col not in names]
+        if missing:
+            raise KeyError(f"Columns not found in {path}: {missing}")
+
+    stats = footer_statistics(dataset, columns)
+    empty = [
+        col for col in columns
+        if stats["null_counts"].get(col) == stats["n_rows"] and stats["n_rows"] > 0
+    ]
+    read = [col for col in columns if col not in empty]
+
+    def batches():
+        for batch in dataset.to_batches(columns=read, batch_size=batch_size):
+            frame = batch.to_pandas()
+            for col in empty:
+                field = dataset.schema.field(col)
+                frame[col] = pa.nulls(batch.num_rows, type=field.type).to_pandas()
+            yield frame[columns]
+
+    return columns, stats, batches()
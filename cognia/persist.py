@@ -0,0 +1,372 @@
+import json
+import struct
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+from .context import ColumnProfile, ProfileContext, _numeric_profiles
+from .corr import correlation_result
+from .duplicates import duplicate_summary
+from .histograms import Histogram, compute_histograms
+from .streaming import StreamingProfiler, _profile_sections
+
+
+FORMAT = "cognia-profile"
+FORMAT_VERSION = 1
+
+# Per numeric column, the rows of the "numeric" array
+_NUMERIC_FIELDS = [
+    "count", "mean", "std", "min", "q1", "median", "q3", "max",
+    "skewness", "kurtosis", "outlier_count"
+]
+
+
+def _json_value(value):
+    # numpy scalars and labels such as timestamps
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+# ---------------- Saving ----------------
+
+def _collect(source):
+    """
+    Profiles, histograms, correlation matrix and data quality summary of
+    a DataFrame or a StreamingProfiler.
+    """
+    if isinstance(source, StreamingProfiler):
+        return (
+            source.profiles(), source.n_rows,
+            {col: Histogram(*hist) for col, hist in source.chart_data()[1].items()},
+            source.correlation.matrix(), source.data_quality()
+        )
+
+    if not isinstance(source, pd.DataFrame):
+        raise TypeError("Input must be a pandas DataFrame or a StreamingProfiler")
+
+    ctx = ProfileContext(source)
+    distinct = ctx.distinct_counts()
+    profiles = []
+    for col in ctx.columns:
+        profile = ctx.profile(col)
+        profile.n_distinct = int(distinct[col])
+        profiles.append(profile)
+
+    duplicates = duplicate_summary(source, context=ctx)
+    return (
+        profiles, ctx.n_rows,
+        compute_histograms(source, bins=30, context=ctx),
+        correlation_result(source, context=ctx).matrix,
+        {
+            "duplicate_records": duplicates["duplicate_records"],
+            "duplicate_percent": duplicates["duplicate_percent"],
+            "numeric_count": len(ctx.numeric_columns),
+            "categorical_count": len(ctx.categorical_columns),
+        }
+    )
+
+
+def save_profile(source, path, top_values=1000):
+    """
+    Writes the profile of a DataFrame or StreamingProfiler to a single
+    uncompressed .npz file: per-column statistics, 30-bin histograms, up
+    to top_values value counts per non-numeric column and the correlation
+    matrix as float32. Reports can later be rendered from load_profile()
+    without the data.
+    """
+    profiles, n_rows, histograms, correlation, data_quality = _collect(source)
+    numeric = [p for p in profiles if p.is_numeric]
+
+    columns = []
+    value_counts = []
+    for p in profiles:
+        entry = {
+            "name": p.name, "dtype": p.dtype, "is_numeric": p.is_numeric,
+            "count": p.count, "null_count": p.null_count, "n_distinct": p.n_unique
+        }
+        if not p.is_numeric:
+            counts = p.value_counts.head(top_values)
+            entry["labels"] = counts.index.tolist()
+            value_counts.append(counts.to_numpy(dtype=np.int64))
+        columns.append(entry)
+
+    hist_columns = [col for col in histograms]
+    meta = {
+        "format": FORMAT,
+        "version": FORMAT_VERSION,
+        "n_rows": n_rows,
+        "columns": columns,
+        "histograms": hist_columns,
+        "data_quality": data_quality
+    }
+
+    arrays = {
+        "meta": np.frombuffer(json.dumps(meta, default=_json_value).encode(), dtype=np.uint8),
+        "numeric": np.array(
+            [[getattr(p, field) for field in _NUMERIC_FIELDS] for p in numeric],
+            dtype=np.float64
+        ).reshape(len(numeric), len(_NUMERIC_FIELDS)),
+        "correlation": correlation.to_numpy(dtype=np.float32),
+        "hist_counts": np.concatenate(
+            [np.asarray(histograms[c].counts, dtype=np.int64) for c in hist_columns] or [np.empty(0, np.int64)]
+        ),
+        "hist_edges": np.concatenate(
+            [np.asarray(histograms[c].edges, dtype=np.float64) for c in hist_columns] or [np.empty(0)]
+        ),
+        "hist_offsets": np.cumsum(
+            [0] + [len(histograms[c].counts) for c in hist_columns], dtype=np.int64
+        ),
+        "value_counts": np.concatenate(value_counts or [np.empty(0, np.int64)]),
+        "value_offsets": np.cumsum([0] + [len(c) for c in value_counts], dtype=np.int64),
+    }
+
+    with open(path, "wb") as f:
+        np.savez(f, **arrays)
+
+
+# ---------------- Loading ----------------
+
+def _mapped_arrays(path) -> dict:
+    """
+    Arrays of an uncompressed .npz file memory-mapped in place: each
+    member's .npy data is located inside the zip and mapped read-only.
+    """
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as f:
+        for info in archive.infolist():
+            name = info.filename[:-len(".npy")]
+            if info.compress_type != zipfile.ZIP_STORED:
+                arrays[name] = np.load(archive.open(info))
+                continue
+
+            # Local file header: 30 bytes, then the file name and extra field
+            f.seek(info.header_offset)
+            header = f.read(30)
+            name_len, extra_len = struct.unpack("<HH", header[26:30])
+            f.seek(info.header_offset + 30 + name_len + extra_len)
+
+            if np.lib.format.read_magic(f) == (1, 0):
+                shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+            if np.prod(shape) == 0:
+                arrays[name] = np.empty(shape, dtype=dtype)
+            else:
+                arrays[name] = np.memmap(
+                    path, dtype=dtype, mode="r", offset=f.tell(), shape=shape,
+                    order="F" if fortran else "C"
+                )
+    return arrays
+
+
+def load_profile(path) -> "SavedProfile":
+    arrays = _mapped_arrays(path)
+    meta = json.loads(bytes(arrays.pop("meta")).decode())
+
+    if meta.get("format") != FORMAT:
+        raise ValueError(f"{path} is not a Cognia profile")
+    if meta["version"] > FORMAT_VERSION:
+        raise ValueError(
+            f"Profile format version {meta['version']} is newer than this "
+            f"Cognia supports ({FORMAT_VERSION})"
+        )
+    return SavedProfile(meta, arrays)
+
+
+class SavedProfile:
+    """
+    A profile read back by load_profile(). Its arrays are memory-mapped,
+    so only the parts that are used get read from disk. Renders like a
+    StreamingProfiler, e.g. eda_report(load_profile(path)).
+    """
+
+    def __init__(self, meta, arrays):
+        self.meta = meta
+        self.arrays = arrays
+        self.n_rows = meta["n_rows"]
+        self.columns = [c["name"] for c in meta["columns"]]
+        self.numeric_columns = [c["name"] for c in meta["columns"] if c["is_numeric"]]
+
+    def profiles(self) -> list:
+        entries = self.meta["columns"]
+        numeric_entries = [c for c in entries if c["is_numeric"]]
+        table = np.asarray(self.arrays["numeric"])
+        stats = {field: table[:, j] for j, field in enumerate(_NUMERIC_FIELDS)}
+
+        numeric = _numeric_profiles(
+            self.numeric_columns,
+            [c["dtype"] for c in numeric_entries],
+            self.n_rows,
+            stats,
+            (stats["q1"], stats["median"], stats["q3"]),
+            stats["outlier_count"]
+        )
+        by_name = {p.name: p for p in numeric}
+        for profile, entry in zip(numeric, numeric_entries):
+            profile.count = entry["count"]
+            profile.null_count = entry["null_count"]
+            profile.n_distinct = entry["n_distinct"]
+
+        offsets = self.arrays["value_offsets"]
+        k = 0
+        for entry in entries:
+            if entry["is_numeric"]:
+                continue
+            counts = np.asarray(self.arrays["value_counts"][offsets[k]:offsets[k + 1]])
+            k += 1
+            by_name[entry["name"]] = ColumnProfile(
+                name=entry["name"],
+                dtype=entry["dtype"],
+                is_numeric=False,
+                count=entry["count"],
+                null_count=entry["null_count"],
+                value_counts=pd.Series(
+                    counts, index=pd.Index(entry["labels"], dtype=object, name=entry["name"]),
+                    name="count"
+                ),
+                n_distinct=entry["n_distinct"]
+            )
+
+        return [by_name[col] for col in self.columns]
+
+    def context(self) -> ProfileContext:
+        return ProfileContext.from_profiles(self.profiles(), n_rows=self.n_rows)
+
+    def correlation(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            self.arrays["correlation"], index=self.numeric_columns, columns=self.numeric_columns
+        )
+
+    def histograms(self) -> dict:
+        counts, edges = self.arrays["hist_counts"], self.arrays["hist_edges"]
+        offsets = self.arrays["hist_offsets"]
+        return {
+            col: Histogram(
+                np.asarray(edges[offsets[j] + j:offsets[j + 1] + j + 1]),
+                np.asarray(counts[offsets[j]:offsets[j + 1]])
+            )
+            for j, col in enumerate(self.meta["histograms"])
+        }
+
+    def chart_data(self) -> tuple:
+        categorical = {}
+        for profile in self.profiles():
+            if profile.is_numeric:
+                continue
+            counts = profile.value_counts.head(10)
+            if counts.empty or counts.nunique() <= 1:
+                continue
+            categorical[profile.name] = counts
+        return categorical, self.histograms()
+
+    def sections(self) -> dict:
+        return _profile_sections(
+            self.context(), self.correlation(), self.meta["data_quality"]
+        )
+
+    def to_dict(self) -> dict:
+        """
+        The stored profile as JSON-ready data (missing and infinite
+        values as None).
+        """
+        histograms = self.histograms()
+        columns = []
+        for profile in self.profiles():
+            entry = {
+                "name": profile.name, "dtype": profile.dtype,
+                "count": profile.count, "null_count": profile.null_count,
+                "n_distinct": profile.n_unique
+            }
+            if profile.is_numeric:
+                for field in _NUMERIC_FIELDS[1:]:
+                    entry[field] = getattr(profile, field)
+                if profile.name in histograms:
+                    hist = histograms[profile.name]
+                    entry["histogram"] = {
+                        "edges": hist.edges.tolist(), "counts": hist.counts.tolist()
+                    }
+            else:
+                entry["top_values"] = {
+                    "labels": profile.value_counts.index.tolist(),
+                    "counts": profile.value_counts.tolist()
+                }
+            columns.append(entry)
+
+        return _without_nan({
+            "format": FORMAT,
+            "version": FORMAT_VERSION,
+            "n_rows": self.n_rows,
+            "columns": columns,
+            "correlation": {
+                "columns": self.numeric_columns,
+                "matrix": np.asarray(self.arrays["correlation"], dtype=np.float64).tolist()
+            },
+            "data_quality": self.meta["data_quality"]
+        })
+
+    def to_json(self, path=None):
+        text = json.dumps(self.to_dict(), default=_json_value, allow_nan=False)
+        if path is None:
+            return text
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+def _without_nan(value):
+    if isinstance(value, dict):
+        return {k: _without_nan(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_without_nan(v) for v in value]
+    if isinstance(value, (float, np.floating)):
+        return float(value) if np.isfinite(value) else None
+    if isinstance(value, np.integer):
+        return int(value)
+    return value
+
+
+# ---------------- Comparison ----------------
+
+_DIFF_FIELDS = [
+    "count", "null_count", "n_distinct", "mean", "std", "min", "median", "max"
+]
+
+
+def _same_value(a, b, rtol) -> bool:
+    if pd.isna(a) and pd.isna(b):
+        return True
+    try:
+        return bool(np.isclose(a, b, rtol=rtol, atol=0.0))
+    except TypeError:
+        return a == b
+
+
+def diff_profiles(old, new, rtol=1e-9) -> pd.DataFrame:
+    """
+    Per-column differences between two profiles (SavedProfile or
+    StreamingProfiler): one row per changed statistic with its old and new
+    values, plus a row for every added or removed column. Numbers within
+    rtol of each other, relative to the new value, count as unchanged.
+    """
+    before = {p.name: p for p in old.profiles()}
+    after = {p.name: p for p in new.profiles()}
+    rows = []
+
+    for col in list(after) + [c for c in before if c not in after]:
+        if col not in before or col not in after:
+            rows.append((col, "column", col in before, col in after, np.nan))
+            continue
+
+        for field in _DIFF_FIELDS:
+            a = getattr(before[col], "n_unique" if field == "n_distinct" else field)
+            b = getattr(after[col], "n_unique" if field == "n_distinct" else field)
+            if _same_value(a, b, rtol):
+                continue
+            try:
+                change = b - a
+            except TypeError:
+                change = np.nan
+            rows.append((col, field, a, b, change))
+
+    return pd.DataFrame(rows, columns=["column", "statistic", "old", "new", "change"])
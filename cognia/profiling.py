@@ -1,16 +1,25 @@
 import pandas as pd
 
-def dataset_overview(df) -> dict:
-    if not isinstance(df, pd.DataFrame):
+from .context import _get_context
+
+def dataset_overview(df, context=None, distinct_precision=None) -> dict:
+    """
+    Row and column counts plus each column's dtype and number of distinct
+    values (estimated for large columns when distinct_precision is set).
+    """
+    if context is None and not isinstance(df, pd.DataFrame):
         raise TypeError("Input must be a pandas DataFrame")
 
+    ctx = _get_context(df, context, distinct_precision=distinct_precision)
+
     column_overview = pd.DataFrame({
-        "column_name": df.columns,
-        "dtype": df.dtypes.astype(str).values
+        "column_name": ctx.columns,
+        "dtype": ctx.dtypes.astype(str).values,
+        "distinct": ctx.distinct_counts().values
     })
 
     return {
-        "rows": df.shape[0],
-        "columns": df.shape[1],
+        "rows": ctx.n_rows,
+        "columns": len(ctx.columns),
         "column_overview": column_overview
     }
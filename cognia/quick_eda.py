@@ -1,3 +1,7 @@
+from collections.abc import Mapping
+
+from .context import _get_context
+from .scheduler import Stage, _resolve_n_jobs, run_stages
 from .profiling import dataset_overview
 from .missing import missing_report
 from .stats import numeric_summary
@@ -9,22 +13,122 @@ from .corr import (
     full_correlation_heatmap
 )
 
-def quick_eda(df):
+
+# ---------------- Sections ----------------
+# Every section is called as func(df, context, *inputs), where inputs are
+# the results of the sections it declares as dependencies.
+
+def _overview(df, context):
+    return dataset_overview(df, context=context)
+
+
+def _missing(df, context):
+    return missing_report(df, context=context)
+
+
+def _statistics(df, context):
+    return numeric_summary(df, context=context)
+
+
+def _outliers(df, context):
+    return outlier_detect(df, context=context)
+
+
+def _interpretation(df, context, statistics):
+    return interpret_distribution(statistics)
+
+
+def _alerts(df, context, statistics, outliers, missing):
+    return _generate_alerts(df, statistics, outliers, missing, context=context)
+
+
+def _correlation(df, context):
+    return {
+        "top_pairs": top_correlated_pairs(df, context=context),
+        "full_correlation_heatmap": full_correlation_heatmap(df, context=context)
+    }
+
+
+_STAGES = [
+    Stage("overview", _overview),
+    Stage("missing", _missing),
+    Stage("statistics", _statistics),
+    Stage("outliers", _outliers),
+    Stage("interpretation", _interpretation, inputs=("statistics",)),
+    # Alert rules are registered per process, so alerts run in the caller
+    Stage("alerts", _alerts, inputs=("statistics", "outliers", "missing"), local=True),
+    Stage("correlation", _correlation),
+]
+
+_SECTIONS = {stage.name: stage for stage in _STAGES}
+
+
+class EDAResult(Mapping):
+    """
+    Read-only mapping of EDA sections, each computed on first access.
+    """
+
+    def __init__(self, df, context=None, quantile_error=None, memory_limit=None,
+                 distinct_precision=None, top_k=None):
+        self.df = df
+        self.context = _get_context(
+            df, context, quantile_error=quantile_error, memory_limit=memory_limit,
+            distinct_precision=distinct_precision, top_k=top_k
+        )
+        self._cache = {}
+
+    def __getitem__(self, key):
+        if key not in _SECTIONS:
+            raise KeyError(key)
+        if key not in self._cache:
+            stage = _SECTIONS[key]
+            inputs = [self[name] for name in stage.inputs]
+            self._cache[key] = stage.func(self.df, self.context, *inputs)
+        return self._cache[key]
+
+    def __iter__(self):
+        return iter(_SECTIONS)
+
+    def __len__(self):
+        return len(_SECTIONS)
+
+    def is_computed(self, key) -> bool:
+        return key in self._cache
+
+    def __repr__(self):
+        computed = [k for k in _SECTIONS if k in self._cache]
+        return f"EDAResult(computed={computed})"
+
+
+def quick_eda(df, context=None, lazy=False, n_jobs=1, backend="thread",
+              quantile_error=None, memory_limit=None, distinct_precision=None,
+              top_k=None):
     """
     Runs complete EDA pipeline.
+
+    With lazy=True an EDAResult is returned and sections are only
+    computed when they are first accessed. Otherwise independent sections
+    run concurrently on n_jobs workers of the given backend
+    ("thread" or "process"). The process backend copies df and the
+    profiles, computed up front, into a worker for every section, so it
+    only pays off when sections are heavier than that copy.
+
+    quantile_error enables approximate quartiles and outlier fences;
+    memory_limit (e.g. "2GB") computes correlations tile by tile within
+    that budget; distinct_precision estimates distinct counts of large
+    columns with HyperLogLog; top_k keeps only the top_k most frequent
+    values of categorical columns.
     """
-    stats = numeric_summary(df)
-    
-    return {
-        "overview": dataset_overview(df),
-        "missing": missing_report(df),
-        "statistics": stats,
-        "outliers": outlier_detect(df),
-        "interpretation": interpret_distribution(stats),
-        "alerts": _generate_alerts(df, stats, outlier_detect(df), missing_report(df)),
-        "correlation": {
-            "top_pairs": top_correlated_pairs(df),
-            "full_correlation_heatmap": full_correlation_heatmap(df)
-        }
-    }
+    options = dict(
+        quantile_error=quantile_error,
+        memory_limit=memory_limit,
+        distinct_precision=distinct_precision,
+        top_k=top_k
+    )
+    if lazy:
+        return EDAResult(df, context=context, **options)
 
+    ctx = _get_context(df, context, n_jobs=n_jobs, **options)
+    if backend == "process" and _resolve_n_jobs(n_jobs) > 1:
+        ctx.prepare()
+    return run_stages(_STAGES, args=(df, ctx), n_jobs=n_jobs, backend=backend)
@@ -1,16 +1,24 @@
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import base64
 from io import BytesIO
 from datetime import datetime
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 
-from .quick_eda import quick_eda
-from .alert import _generate_alerts
-from .corr import (
-    top_correlated_pairs,
-    full_correlation_heatmap
-)
+from .alert import _rules_fingerprint, alert_rules
+from .cache import _open_cache, table_fingerprint
+from .context import ProfileContext, _get_context
+from .duplicates import duplicate_summary
+from .histograms import compute_histograms
+from .parquet import parquet_batches
+from .persist import SavedProfile
+from .quick_eda import _STAGES
+from .scheduler import Stage, _resolve_n_jobs, run_stages
+from .streaming import StreamingProfiler
 
 
 
@@ -48,131 +56,454 @@ def _encode_plot(fig):
     return base64.b64encode(buf.read()).decode("utf-8")
 
 
-def _categorical_charts(df):
-    charts = {}
+def _category_chart(col, counts: pd.Series) -> str:
+    fig = Figure(figsize=(7, 4))
+    ax = fig.subplots()
 
-    for col in df.select_dtypes(exclude="number").columns:
-        counts = df[col].value_counts().head(10)
+    colors = plt.cm.Set3(range(len(counts)))
+
+    bars = ax.bar(
+        counts.index.astype(str),
+        counts.values,
+        color=colors
+    )
+
+    ax.set_title(f"{col} – Category Distribution", fontsize=12)
+    ax.set_ylabel("Count")
+    ax.set_xticks(range(len(counts)))
+    ax.set_xticklabels(counts.index.astype(str), rotation=45, ha="right")
+
+    max_val = counts.values.max()
+    ax.set_ylim(0, max_val * 1.15)
+
+    for bar in bars:
+        height = bar.get_height()
+        ax.text(
+            bar.get_x() + bar.get_width() / 2,
+            height + max_val * 0.02,
+            f"{int(height)}",
+            ha="center",
+            va="bottom",
+            fontsize=9,
+            fontweight="bold"
+        )
+
+    fig.tight_layout()
+
+    # 🔴 THIS IS THE KEY FIX
+    return _encode_plot(fig)
+
+
+def _categorical_chart_data(df, context=None):
+    ctx = _get_context(df, context)
+    data = {}
+
+    for profile in ctx.categorical_profiles():
+        counts = profile.value_counts.head(10)
 
         # Safety check
         if counts.empty or counts.nunique() <= 1:
             continue
 
-        fig, ax = plt.subplots(figsize=(7, 4))
+        data[profile.name] = counts
 
-        colors = plt.cm.Set3(range(len(counts)))
+    return data
 
-        bars = ax.bar(
-            counts.index.astype(str),
-            counts.values,
-            color=colors
-        )
 
-        ax.set_title(f"{col} – Category Distribution", fontsize=12)
-        ax.set_ylabel("Count")
-        ax.set_xticks(range(len(counts)))
-        ax.set_xticklabels(counts.index.astype(str), rotation=45, ha="right")
+def _histogram_chart(col, edges, counts) -> str:
+    fig = Figure(figsize=(7, 4))
+    ax = fig.subplots()
 
-        max_val = counts.values.max()
-        ax.set_ylim(0, max_val * 1.15)
+    # Pre-binned counts are drawn as weights on the bin edges
+    ax.hist(
+        edges[:-1],
+        bins=edges,
+        weights=counts,
+        edgecolor="black"
+    )
 
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(
-                bar.get_x() + bar.get_width() / 2,
-                height + max_val * 0.02,
-                f"{int(height)}",
-                ha="center",
-                va="bottom",
-                fontsize=9,
-                fontweight="bold"
-            )
+    ax.set_title(f"{col} – Distribution", fontsize=12)
+    ax.set_xlabel(col)
+    ax.set_ylabel("Frequency")
 
-        plt.tight_layout()
+    fig.tight_layout()
 
-        # 🔴 THIS IS THE KEY FIX
-        charts[col] = _encode_plot(fig)
+    return _encode_plot(fig)   # ✅ pass figure
 
-        plt.close(fig)
 
-    return charts
+def _numeric_chart_data(df, context=None):
+    # Empty numeric columns are left out
+    return compute_histograms(df, bins=30, context=context)
 
 
-def _numeric_charts(df):
-    charts = {}
+def _render_chart(job):
+    func, args = job
+    return func(*args)
 
-    for col in df.select_dtypes(include="number").columns:
-        data = df[col].dropna()
 
-        # Skip empty numeric columns
-        if data.empty:
-            continue
+def _chart_key(func, args):
+    # A chart is determined by its column name and the data it draws
+    return ("chart", func.__name__) + tuple(
+        arg.index.tolist() + np.asarray(arg).tolist() if isinstance(arg, pd.Series)
+        else np.asarray(arg).tolist()
+        for arg in args
+    )
 
-        fig, ax = plt.subplots(figsize=(7, 4))
 
-        ax.hist(
-            data,
-            bins=30,
-            edgecolor="black"
-        )
+def _render_charts(categorical, numeric, n_jobs=1, cache=None):
+    """
+    Renders categorical ({col: counts}) and numeric ({col: (edges, counts)})
+    chart data to encoded PNGs.
+
+    With n_jobs > 1 the figures are drawn on a process pool; workers only
+    receive the precomputed counts and bins. Charts keep their input order.
+    With a ResultCache, charts of unchanged data are loaded from it.
+    """
+    jobs = [(_category_chart, (col, counts)) for col, counts in categorical.items()]
+    jobs += [(_histogram_chart, (col, *data)) for col, data in numeric.items()]
+
+    images = [None] * len(jobs)
+    if cache is not None:
+        keys = [_chart_key(*job) for job in jobs]
+        images = [cache.get(key) for key in keys]
+    todo = [i for i, image in enumerate(images) if image is None]
+
+    n_jobs = min(_resolve_n_jobs(n_jobs), len(todo))
+    if n_jobs <= 1:
+        rendered = [_render_chart(jobs[i]) for i in todo]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            chunksize = max(1, len(todo) // (4 * n_jobs))
+            rendered = list(executor.map(
+                _render_chart, [jobs[i] for i in todo], chunksize=chunksize
+            ))
+
+    for i, image in zip(todo, rendered):
+        images[i] = image
+        if cache is not None:
+            cache.put(keys[i], image)
+
+    images = iter(images)
+    return (
+        {col: next(images) for col in categorical},
+        {col: next(images) for col in numeric}
+    )
+
+
+def _data_quality_summary(df, context=None):
+    ctx = _get_context(df, context)
+    duplicates = duplicate_summary(df, context=ctx)
+    return {
+        "duplicate_records": duplicates["duplicate_records"],
+        "duplicate_percent": duplicates["duplicate_percent"],
+        "numeric_count": len(ctx.numeric_columns),
+        "categorical_count": len(ctx.categorical_columns),
+    }
 
-        ax.set_title(f"{col} – Distribution", fontsize=12)
-        ax.set_xlabel(col)
-        ax.set_ylabel("Frequency")
 
-        plt.tight_layout()
+# ===================== CLIENT-SIDE CHARTS =====================
 
-        charts[col] = _encode_plot(fig)   # ✅ pass figure
-        plt.close(fig)                    # ✅ close explicitly
+# Minimal SVG renderer for charts="client": bar charts for categories,
+# contiguous bars over bin edges for histograms.
+_CHART_JS = """
+const PALETTE = ["#8dd3c7", "#ffffb3", "#bebada", "#fb8072", "#80b1d3", "#fdb462",
+                 "#b3de69", "#fccde5", "#d9d9d9", "#bc80bd", "#ccebc5", "#ffed6f"];
 
-    return charts
+function esc(s) {
+    return String(s).replace(/[&<>"]/g, c => ({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})[c]);
+}
 
+function fmt(v) {
+    return Math.abs(v) >= 1e4 || (v !== 0 && Math.abs(v) < 1e-2) ? v.toExponential(2) : +v.toFixed(2);
+}
 
-def _data_quality_summary(df):
-    return {
-        "duplicate_records": int(df.duplicated().sum()),
-        "duplicate_percent": round(df.duplicated().mean() * 100, 2),
-        "numeric_count": df.select_dtypes(include="number").shape[1],
-        "categorical_count": df.select_dtypes(exclude="number").shape[1],
+function drawChart(svgId, chart, col) {
+    const W = 700, H = 400, L = 60, R = 20, T = 40, B = 90;
+    const counts = chart.counts, n = counts.length, hist = "edges" in chart;
+    const top = Math.max(...counts) * 1.15 || 1;
+    const w = (W - L - R) / n, plotH = H - T - B;
+    const title = col + (hist ? " – Distribution" : " – Category Distribution");
+
+    let out = `<text x="${W / 2}" y="24" text-anchor="middle" font-size="15">${esc(title)}</text>`;
+    for (let k = 0; k <= 4; k++) {
+        const y = H - B - plotH * k / 4;
+        out += `<line x1="${L - 4}" y1="${y}" x2="${L}" y2="${y}" stroke="#333"/>`;
+        out += `<text x="${L - 8}" y="${y + 4}" text-anchor="end" font-size="11">${Math.round(top * k / 4)}</text>`;
+    }
+
+    counts.forEach((c, i) => {
+        const h = plotH * c / top, x = L + i * w, y = H - B - h;
+        if (hist) {
+            out += `<rect x="${x}" y="${y}" width="${w}" height="${h}" fill="#1f77b4" stroke="black"><title>${c}</title></rect>`;
+        } else {
+            const cx = x + w / 2;
+            out += `<rect x="${x + w * 0.1}" y="${y}" width="${w * 0.8}" height="${h}" fill="${PALETTE[i % PALETTE.length]}"/>`;
+            out += `<text x="${cx}" y="${y - 4}" text-anchor="middle" font-size="11" font-weight="bold">${c}</text>`;
+            out += `<text transform="translate(${cx},${H - B + 12}) rotate(-45)" text-anchor="end" font-size="11">${esc(chart.labels[i])}</text>`;
+        }
+    });
+
+    if (hist) {
+        const edges = chart.edges, lo = edges[0], span = edges[n] - lo || 1;
+        for (let k = 0; k <= 5; k++) {
+            const v = lo + span * k / 5, x = L + (W - L - R) * k / 5;
+            out += `<text x="${x}" y="${H - B + 16}" text-anchor="middle" font-size="11">${fmt(v)}</text>`;
+        }
+        out += `<text x="${W / 2}" y="${H - B + 40}" text-anchor="middle" font-size="12">${esc(col)}</text>`;
     }
 
+    out += `<line x1="${L}" y1="${H - B}" x2="${W - R}" y2="${H - B}" stroke="#333"/>`;
+    out += `<line x1="${L}" y1="${T}" x2="${L}" y2="${H - B}" stroke="#333"/>`;
+    document.getElementById(svgId).innerHTML = out;
+}
+"""
+
+
+def _client_charts(categorical, numeric):
+    """
+    Chart data as compact JSON-ready dicts for the in-browser renderer.
+    """
+    return (
+        {
+            str(col): {"labels": counts.index.astype(str).tolist(),
+                       "counts": np.asarray(counts).tolist()}
+            for col, counts in categorical.items()
+        },
+        {
+            str(col): {"edges": np.asarray(edges).tolist(),
+                       "counts": np.asarray(counts).tolist()}
+            for col, (edges, counts) in numeric.items()
+        }
+    )
+
+
+def _chart_sections(categorical, numeric, charts, n_jobs, cache=None):
+    if charts == "client":
+        return _client_charts(categorical, numeric)
+    return _render_charts(categorical, numeric, n_jobs, cache)
+
+
+def _check_charts(charts):
+    if charts not in ("image", "client"):
+        raise ValueError("charts must be 'image' or 'client'")
+
+
+def _check_unused(source, **options):
+    # Options given (not None) that the report from source cannot apply
+    unused = [name for name, value in options.items() if value is not None]
+    if unused:
+        raise ValueError(f"{', '.join(unused)} cannot be applied to a report from {source}")
+
+
+def _script_json(data) -> str:
+    # Keep "</script>" inside values from closing the script element
+    return json.dumps(data).replace("</", "<\\/")
 
 
 # ===================== MAIN REPORT =====================
 
+_REPORT_STAGES = _STAGES + [
+    Stage("data_quality", _data_quality_summary),
+    Stage("categorical_chart_data", _categorical_chart_data),
+    Stage("numeric_chart_data", _numeric_chart_data),
+]
+
+
 def eda_report(
     df: pd.DataFrame,
     output_file="cognia_eda_report.html",
-    show_full_correlation=False
+    show_full_correlation=False,
+    n_jobs=1,
+    backend="thread",
+    quantile_error=None,
+    memory_limit=None,
+    distinct_precision=None,
+    top_k=None,
+    charts="image",
+    cache=None,
+    columns=None
 ) -> str:
+    """
+    Builds the HTML EDA report for a DataFrame, or from a StreamingProfiler
+    (e.g. one returned by profile() and updated with new rows) or a
+    profile read back with load_profile().
+
+    charts="client" embeds chart data as JSON and draws the charts in the
+    browser instead of embedding rendered PNGs.
+
+    cache (a directory or a ResultCache) keeps computed sections and
+    rendered charts on disk: a report on data whose column fingerprints
+    and options are unchanged is rebuilt from the cache, and otherwise
+    only the changed columns are profiled again.
 
-    result = quick_eda(df)
+    With n_jobs > 1 and backend="process" columns are profiled before the
+    stages are dispatched, and df and the profiles are copied into a
+    worker process for every stage.
 
+    df may also be the path of a Parquet file or directory, which is
+    profiled batch by batch, see eda_report_from_parquet. columns limits
+    the report to those columns.
+
+    Options a profile or a Parquet path cannot apply (such as memory_limit
+    or cache, or any profiling option for an existing profile) raise a
+    ValueError rather than being ignored.
+    """
+    _check_charts(charts)
+    process = backend if backend != "thread" else None
+
+    if isinstance(df, (StreamingProfiler, SavedProfile)):
+        _check_unused(
+            "a profile", backend=process, quantile_error=quantile_error,
+            memory_limit=memory_limit, distinct_precision=distinct_precision,
+            top_k=top_k, cache=cache, columns=columns
+        )
+        return _profiler_report(df, output_file, show_full_correlation, n_jobs, charts)
+
+    if isinstance(df, (str, os.PathLike)):
+        _check_unused("a Parquet path", backend=process, memory_limit=memory_limit, cache=cache)
+        sketch_options = {
+            k: v for k, v in (("quantile_error", quantile_error),
+                              ("distinct_precision", distinct_precision),
+                              ("top_k", top_k)) if v is not None
+        }
+        return eda_report_from_parquet(
+            df, output_file, show_full_correlation, columns=columns,
+            n_jobs=n_jobs, charts=charts, **sketch_options
+        )
+
+    if columns is not None:
+        df = df[list(columns)]
+
+    options = dict(
+        quantile_error=quantile_error,
+        memory_limit=memory_limit,
+        distinct_precision=distinct_precision,
+        top_k=top_k
+    )
+    cache = _open_cache(cache)
+
+    def compute():
+        ctx = ProfileContext(df, cache=cache, n_jobs=n_jobs, **options)
+        if backend == "process" and _resolve_n_jobs(n_jobs) > 1:
+            ctx.prepare()
+        return run_stages(
+            _REPORT_STAGES,
+            args=(df, ctx),
+            n_jobs=n_jobs,
+            backend=backend
+        )
+
+    if cache is None:
+        result = compute()
+    else:
+        key = (
+            "report", table_fingerprint(df), tuple(options.items()),
+            _rules_fingerprint(alert_rules())
+        )
+        result = dict(cache.cached(key, compute))
+
+    result["categorical_charts"], result["numeric_charts"] = _chart_sections(
+        result.pop("categorical_chart_data"), result.pop("numeric_chart_data"),
+        charts, n_jobs, cache
+    )
+
+    return _render_report(result, output_file, show_full_correlation, charts)
+
+
+def eda_report_from_csv(
+    path,
+    output_file="cognia_eda_report.html",
+    show_full_correlation=False,
+    chunksize=100_000,
+    quantile_error=0.005,
+    distinct_precision=14,
+    n_jobs=1,
+    charts="image",
+    exact_duplicates=False,
+    **read_csv_kwargs
+) -> str:
+    """
+    Builds the EDA report from a CSV file read in chunks, without loading
+    the whole file into memory. Quantiles, outlier counts, top categories,
+    histograms and (see StreamingProfiler) duplicate rows are estimated
+    from bounded-size sketches.
+    """
+    _check_charts(charts)
+
+    profiler = StreamingProfiler(
+        quantile_error=quantile_error, distinct_precision=distinct_precision,
+        exact_duplicates=exact_duplicates
+    )
+    for chunk in pd.read_csv(path, chunksize=chunksize, **read_csv_kwargs):
+        profiler.update(chunk)
+
+    return _profiler_report(profiler, output_file, show_full_correlation, n_jobs, charts)
+
+
+def eda_report_from_parquet(
+    path,
+    output_file="cognia_eda_report.html",
+    show_full_correlation=False,
+    columns=None,
+    batch_size=100_000,
+    quantile_error=0.005,
+    distinct_precision=14,
+    top_k=1000,
+    n_jobs=1,
+    charts="image",
+    exact_duplicates=False
+) -> str:
+    """
+    Builds the EDA report from a Parquet file or partitioned directory,
+    read one record batch at a time with pyarrow and only for the given
+    columns. Footer statistics give the value ranges of numeric columns
+    up front, and columns they show entirely missing are not read.
+    """
+    _check_charts(charts)
+
+    columns, stats, batches = parquet_batches(path, columns=columns, batch_size=batch_size)
+    profiler = StreamingProfiler(
+        quantile_error=quantile_error, distinct_precision=distinct_precision,
+        top_k=top_k, ranges=stats["ranges"], exact_duplicates=exact_duplicates
+    )
+    for batch in batches:
+        profiler.update(batch)
+
+    return _profiler_report(profiler, output_file, show_full_correlation, n_jobs, charts)
+
+
+def _profiler_report(profiler, output_file, show_full_correlation, n_jobs, charts) -> str:
+    result = profiler.sections()
+    result["categorical_charts"], result["numeric_charts"] = _chart_sections(
+        *profiler.chart_data(), charts, n_jobs
+    )
+    return _render_report(result, output_file, show_full_correlation, charts)
+
+
+def _render_report(result, output_file, show_full_correlation, charts="image") -> str:
     overview = result["overview"]
     missing = result["missing"]
     stats = result["statistics"]
     outliers = result["outliers"]
     interpretation = result["interpretation"]
+    alerts = result["alerts"]
 
-    dq = _data_quality_summary(df)
-    alerts = _generate_alerts(df, stats, outliers, missing)
-    cat_charts = _categorical_charts(df)
-    num_charts = _numeric_charts(df)
-    numeric_cols = df.select_dtypes(include="number").columns.tolist() 
+    dq = result["data_quality"]
+    cat_charts = result["categorical_charts"]
+    num_charts = result["numeric_charts"]
+    n_numeric = dq["numeric_count"]
 
     # ---------- Correlation logic ----------
     corr_section_html = ""
     first_num = next(iter(num_charts)) if num_charts else None
     first_cat = next(iter(cat_charts)) if cat_charts else None
 
-    numeric_cols = df.select_dtypes(include="number").columns.tolist()
-
-    if len(numeric_cols) > 10:
+    if n_numeric > 10:
         corr_section_html += "<h3>🔝 Top Correlated Feature Pairs</h3>"
-        corr_section_html += _df_to_html(top_correlated_pairs(df))
+        corr_section_html += _df_to_html(result["correlation"]["top_pairs"])
 
         if show_full_correlation:
-            full_img = full_correlation_heatmap(df)
+            full_img = result["correlation"]["full_correlation_heatmap"]
             if full_img:
                 corr_section_html += f"""
                 <details style="margin-top:25px;">
@@ -183,7 +514,7 @@ def eda_report(
                 </details>
                 """
     else:
-        full_img = full_correlation_heatmap(df)
+        full_img = result["correlation"]["full_correlation_heatmap"]
         if full_img:
             corr_section_html += f"""
             <img src="data:image/png;base64,{full_img}" />
@@ -192,16 +523,41 @@ def eda_report(
 
     # ---------- Explorer Sections (Safe Rendering) ----------
 
+    if charts == "client":
+        cat_select = "drawChart('catChart', catCharts[this.value], this.value)"
+        num_select = "drawChart('numChart', numCharts[this.value], this.value)"
+        cat_view = '<svg id="catChart" viewBox="0 0 700 400"></svg>'
+        num_view = '<svg id="numChart" viewBox="0 0 700 400"></svg>'
+        chart_script = _CHART_JS + (
+            f"const catCharts = {_script_json(cat_charts)};\n"
+            f"const numCharts = {_script_json(num_charts)};\n"
+        )
+        if cat_charts:
+            key = _script_json(first_cat)
+            chart_script += f"drawChart('catChart', catCharts[{key}], {key});\n"
+        if num_charts:
+            key = _script_json(first_num)
+            chart_script += f"drawChart('numChart', numCharts[{key}], {key});\n"
+    else:
+        cat_select = "document.getElementById('catImg').src = catCharts[this.value]"
+        num_select = "document.getElementById('numImg').src = numCharts[this.value]"
+        cat_view = f'<img id="catImg" src="data:image/png;base64,{cat_charts[first_cat]}" />' if cat_charts else ""
+        num_view = f'<img id="numImg" src="data:image/png;base64,{num_charts[first_num]}" />' if num_charts else ""
+        chart_script = f"""
+            const catCharts = {json.dumps({k: "data:image/png;base64," + v for k, v in cat_charts.items()})};
+            const numCharts = {json.dumps({k: "data:image/png;base64," + v for k, v in num_charts.items()})};
+        """
+
     cat_explorer_html = (
         f"""
         <div class="section">
             <h2>6️⃣ Categorical Column Explorer</h2>
             <div style="text-align:center;">
-                <select onchange="document.getElementById('catImg').src = catCharts[this.value]">
+                <select onchange="{cat_select}">
                     {''.join([f"<option value='{c}'>{c}</option>" for c in cat_charts])}
                 </select>
             </div>
-            <img id="catImg" src="data:image/png;base64,{cat_charts[first_cat]}" />
+            {cat_view}
         </div>
         """
         if cat_charts else
@@ -220,11 +576,11 @@ def eda_report(
         <div class="section">
             <h2>7️⃣ Numeric Column Explorer</h2>
             <div style="text-align:center;">
-                <select onchange="document.getElementById('numImg').src = numCharts[this.value]">
+                <select onchange="{num_select}">
                     {''.join([f"<option value='{c}'>{c}</option>" for c in num_charts])}
                 </select>
             </div>
-            <img id="numImg" src="data:image/png;base64,{num_charts[first_num]}" />
+            {num_view}
         </div>
         """
         if num_charts else
@@ -318,11 +674,15 @@ def eda_report(
                 margin-bottom: 20px;
             }}
 
-            img {{
+            img, svg {{
                 display: block;
                 margin: 0 auto;
                 max-width: 100%;
             }}
+
+            svg {{
+                width: 700px;
+            }}
         </style>
     </head>
 
@@ -339,7 +699,7 @@ def eda_report(
         <div class="section">
             <h2>1️⃣ Dataset Overview</h2>
             {_df_to_html(overview["column_overview"])}
-            <p><b>Duplicate Records:</b> {dq["duplicate_records"]} ({dq["duplicate_percent"]}%)</p>
+            <p><b>Duplicate Records:</b> {"~" if dq.get("duplicates_estimated") else ""}{dq["duplicate_records"]} ({dq["duplicate_percent"]}%{", estimated" if dq.get("duplicates_estimated") else ""})</p>
             <p><b>Numeric Columns:</b> {dq["numeric_count"]}</p>
             <p><b>Categorical Columns:</b> {dq["categorical_count"]}</p>
         </div>
@@ -377,10 +737,7 @@ def eda_report(
             ]) if alerts else "<p style='color:green;font-weight:600;'>✅ No major data quality issues detected</p>"}
         </div>
 
-        <script>
-            const catCharts = {json.dumps({k: "data:image/png;base64," + v for k, v in cat_charts.items()})};
-            const numCharts = {json.dumps({k: "data:image/png;base64," + v for k, v in num_charts.items()})};
-        </script>
+        <script>{chart_script}</script>
 
         <p style="text-align:center;color:gray;">
             Generated by <b>Cognia</b> · Kashish Pundir
@@ -0,0 +1,476 @@
+import numpy as np
+import pandas as pd
+
+from .moments import _BLOCK_ROWS
+
+
+# ---------------- Quantiles ----------------
+
+class QuantileSketch:
+    """
+    Mergeable KLL quantile sketch.
+
+    Keeps a bounded number of weighted samples in levels of compactors;
+    while nothing has been compacted the sketch is exact. The rank error
+    is roughly 3 / k, see for_error.
+    """
+
+    def __init__(self, k=200, seed=0):
+        self.k = k
+        self.n = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @classmethod
+    def for_error(cls, error, seed=0) -> "QuantileSketch":
+        """
+        Returns a sketch sized for the given rank error (e.g. 0.005 = 0.5%).
+        """
+        if not 0 < error < 1:
+            raise ValueError("error must be between 0 and 1")
+        return cls(k=max(8, int(np.ceil(3 / error))), seed=seed)
+
+    @property
+    def is_exact(self) -> bool:
+        return len(self.levels) == 1
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) <= self._capacity(level):
+                level += 1
+                continue
+
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+
+            # Keep one item back on odd sizes so total weight is preserved
+            items = np.sort(items)
+            keep = items[:len(items) % 2]
+            offset = self._rng.integers(2)
+            promoted = items[len(keep):][offset::2]
+
+            self.levels[level] = keep
+            self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+
+            # A new level shrinks every capacity below it
+            level = 0
+
+    def update(self, values) -> "QuantileSketch":
+        values = np.asarray(values, dtype=np.float64).ravel()
+        # Large inputs go in blocks so no sorted copy of them all is made
+        if len(values) > _BLOCK_ROWS:
+            for start in range(0, len(values), _BLOCK_ROWS):
+                self.update(values[start:start + _BLOCK_ROWS])
+            return self
+
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+
+        self.n += len(values)
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+
+        level = int(np.log2(len(values) / self.k)) if len(values) > 2 * self.k else 0
+        if level == 0:
+            self.levels[0] = np.concatenate([self.levels[0], values])
+        else:
+            self._ingest(values, level)
+
+        self._compress()
+        return self
+
+    def _ingest(self, values, level):
+        """
+        Adds a large batch in one step: one order statistic is kept per
+        block of 2**level ranks (what repeated compactions would keep) and
+        the remainder is split into power-of-two blocks so that total
+        weight is preserved.
+        """
+        step = 2 ** level
+        full, remainder = divmod(len(values), step)
+
+        positions = [step * np.arange(full) + self._rng.integers(step)]
+        levels = [np.full(full, level)]
+        start = full * step
+        for h in range(level - 1, -1, -1):
+            if remainder & (1 << h):
+                positions.append(np.array([start + self._rng.integers(1 << h)]))
+                levels.append(np.array([h]))
+                start += 1 << h
+
+        positions = np.concatenate(positions)
+        levels = np.concatenate(levels)
+        # A full (vectorized) sort beats multi-kth partitioning here
+        items = np.sort(values)[positions]
+
+        while len(self.levels) <= level:
+            self.levels.append(np.empty(0))
+        for h in range(level + 1):
+            self.levels[h] = np.concatenate([self.levels[h], items[levels == h]])
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        merged = QuantileSketch(k=min(self.k, other.k))
+        merged.n = self.n + other.n
+        merged.min = min(self.min, other.min)
+        merged.max = max(self.max, other.max)
+
+        depth = max(len(self.levels), len(other.levels))
+        merged.levels = [
+            np.concatenate([
+                self.levels[h] if h < len(self.levels) else np.empty(0),
+                other.levels[h] if h < len(other.levels) else np.empty(0)
+            ])
+            for h in range(depth)
+        ]
+        merged._compress()
+        return merged
+
+    def _weighted(self):
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)
+        ])
+        order = np.argsort(items, kind="stable")
+        return items[order], weights[order]
+
+    def quantile(self, q):
+        """
+        Returns the q-th quantile(s); exact (linear interpolation) while the
+        sketch holds every value.
+        """
+        q = np.asarray(q, dtype=np.float64)
+        if self.n == 0:
+            return np.full(q.shape, np.nan)
+        if self.is_exact:
+            return np.quantile(self.levels[0], q)
+
+        items, weights = self._weighted()
+        cumulative = np.cumsum(weights)
+        idx = np.searchsorted(cumulative, q * cumulative[-1], side="left")
+        result = items[np.clip(idx, 0, len(items) - 1)]
+
+        return np.where(q <= 0, self.min, np.where(q >= 1, self.max, result))
+
+    def outlier_count(self, lower, upper) -> float:
+        """
+        Estimated number of values outside [lower, upper].
+        """
+        if self.n == 0:
+            return 0.0
+        items, weights = self._weighted()
+        return float(weights[(items < lower) | (items > upper)].sum())
+
+    def count_below(self, x) -> float:
+        if self.n == 0:
+            return 0.0
+        items, weights = self._weighted()
+        return float(weights[items < x].sum())
+
+    def count_above(self, x) -> float:
+        if self.n == 0:
+            return 0.0
+        items, weights = self._weighted()
+        return float(weights[items > x].sum())
+
+
+# ---------------- Frequent values ----------------
+
+class TopKSketch:
+    """
+    Space-Saving summary of the most frequent values.
+
+    At most ``capacity`` counters are kept; once values have been evicted
+    counts are upper bounds that overestimate by at most ``floor``. Each
+    counter also tracks its own overestimate in ``errors``, see bounds.
+    """
+
+    def __init__(self, capacity=1000):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype="int64")
+        self.errors = pd.Series(dtype="int64")
+        self.truncated = False
+
+    @property
+    def floor(self) -> int:
+        return int(self.counts.min()) if self.truncated else 0
+
+    def _combine(self, counts: pd.Series, errors: pd.Series, floor: int, truncated: bool):
+        # A value missing from one side may have had up to that side's
+        # floor occurrences evicted there
+        index = self.counts.index.union(counts.index, sort=False)
+        total = (
+            self.counts.reindex(index).fillna(self.floor)
+            + counts.reindex(index).fillna(floor)
+        ).astype("int64")
+        error = (
+            self.errors.reindex(index).fillna(self.floor)
+            + errors.reindex(index).fillna(floor)
+        ).astype("int64")
+
+        self.truncated = self.truncated or truncated
+        if len(total) > self.capacity:
+            total = total.nlargest(self.capacity, keep="first")
+            self.truncated = True
+
+        self.counts = total
+        self.errors = error.reindex(total.index)
+
+    def update(self, values) -> "TopKSketch":
+        if not isinstance(values, pd.Series):
+            values = pd.Series(values)
+        return self.update_counts(values.value_counts())
+
+    def update_counts(self, counts: pd.Series) -> "TopKSketch":
+        """
+        Adds exact counts (a value_counts result) of a batch of values.
+        """
+        self._combine(counts, pd.Series(0, index=counts.index), floor=0, truncated=False)
+        return self
+
+    def merge(self, other: "TopKSketch") -> "TopKSketch":
+        merged = TopKSketch(capacity=min(self.capacity, other.capacity))
+        merged.counts = self.counts
+        merged.errors = self.errors
+        merged.truncated = self.truncated
+        merged._combine(other.counts, other.errors, other.floor, other.truncated)
+        return merged
+
+    def top(self, n=10) -> pd.Series:
+        return self.counts.sort_values(ascending=False, kind="stable").head(n)
+
+    def bounds(self, n=10) -> pd.DataFrame:
+        """
+        The n most frequent values with their estimated count and the
+        range [lower, count] that contains the true count.
+        """
+        top = self.top(n)
+        return pd.DataFrame({
+            "count": top,
+            "lower": top - self.errors.reindex(top.index)
+        })
+
+    @property
+    def n_distinct(self) -> int:
+        # Exact until a value has been evicted, a lower bound afterwards
+        return len(self.counts)
+
+
+# ---------------- Distinct counts ----------------
+
+def _bit_length(x: np.ndarray) -> np.ndarray:
+    """
+    Number of significant bits of each uint64.
+    """
+    n = np.minimum(np.frexp(x.astype(np.float64))[1], 64).astype(np.int64)
+    # The float conversion can round up to the next power of two
+    low = np.left_shift(np.uint64(1), np.maximum(n - 1, 0).astype(np.uint64))
+    return n - ((x < low) & (n > 0))
+
+
+class HyperLogLog:
+    """
+    Mergeable HyperLogLog distinct-value counter over 64-bit value hashes.
+
+    With 2**precision registers the relative error is about
+    1.04 / sqrt(2**precision) (0.8% at the default 14). Until more than
+    exact_limit distinct hashes have been seen they are kept as is and the
+    count is exact.
+    """
+
+    def __init__(self, precision=14, exact_limit=None):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.exact_limit = 2 ** precision if exact_limit is None else exact_limit
+        self.registers = None
+        self.hashes = np.empty(0, dtype=np.uint64)
+
+    @property
+    def is_exact(self) -> bool:
+        return self.registers is None
+
+    def _fold(self, hashes):
+        p = self.precision
+        if self.registers is None:
+            self.registers = np.zeros(2 ** p, dtype=np.uint8)
+
+        idx = (hashes >> np.uint64(64 - p)).astype(np.intp)
+        rest = hashes & np.uint64((1 << (64 - p)) - 1)
+        rank = (64 - p) - _bit_length(rest) + 1
+        np.maximum.at(self.registers, idx, rank.astype(np.uint8))
+
+    def update_hashes(self, hashes) -> "HyperLogLog":
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if not self.is_exact:
+            self._fold(hashes)
+            return self
+
+        hashes = pd.unique(hashes)
+        if len(hashes) <= self.exact_limit:
+            self.hashes = np.union1d(self.hashes, hashes)
+            if len(self.hashes) <= self.exact_limit:
+                return self
+            hashes = self.hashes
+        else:
+            self._fold(self.hashes)
+
+        # Too many distinct values to keep: switch to registers
+        self._fold(hashes)
+        self.hashes = np.empty(0, dtype=np.uint64)
+        return self
+
+    def update(self, values) -> "HyperLogLog":
+        """
+        Adds the non-missing values of a Series (or array).
+        """
+        if not isinstance(values, pd.Series):
+            values = pd.Series(values)
+        # Hashing strings directly is cheaper than factorizing them first
+        hashes = pd.util.hash_pandas_object(values.dropna(), index=False, categorize=False)
+        return self.update_hashes(hashes.to_numpy())
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge counters of different precision")
+
+        merged = HyperLogLog(self.precision, min(self.exact_limit, other.exact_limit))
+        for counter in (self, other):
+            if counter.is_exact:
+                merged.update_hashes(counter.hashes)
+            else:
+                if merged.is_exact:
+                    merged._fold(merged.hashes)
+                    merged.hashes = np.empty(0, dtype=np.uint64)
+                merged.registers = np.maximum(merged.registers, counter.registers)
+        return merged
+
+    @property
+    def relative_error(self) -> float:
+        # Standard error of count(), relative to the count
+        return 0.0 if self.is_exact else 1.04 / 2 ** (self.precision / 2)
+
+    def count(self) -> int:
+        if self.is_exact:
+            return len(self.hashes)
+
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+
+        # Linear counting is more accurate while many registers are empty
+        zeros = int((self.registers == 0).sum())
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)
+
+        return int(round(estimate))
+
+
+# ---------------- Histograms ----------------
+
+class StreamingHistogram:
+    """
+    Fixed-size histogram whose range grows with the data.
+
+    When a value falls outside the current range the bin width is doubled
+    and adjacent bins are merged pairwise.
+    """
+
+    def __init__(self, bins=256):
+        if bins % 2:
+            raise ValueError("bins must be even")
+        self.bins = bins
+        self.lo = None
+        self.width = None
+        self.counts = np.zeros(bins, dtype=np.int64)
+
+    @property
+    def hi(self):
+        return self.lo + self.width * self.bins
+
+    @property
+    def edges(self) -> np.ndarray:
+        return self.lo + self.width * np.arange(self.bins + 1)
+
+    def _grow(self, downward):
+        merged = np.zeros(self.bins, dtype=np.int64)
+        if downward:
+            np.add.at(merged, (self.bins + np.arange(self.bins)) // 2, self.counts)
+            self.lo -= self.width * self.bins
+        else:
+            np.add.at(merged, np.arange(self.bins) // 2, self.counts)
+        self.counts = merged
+        self.width *= 2
+
+    def _add(self, values, weights=None):
+        idx = ((values - self.lo) / self.width).astype(np.int64)
+        idx = np.clip(idx, 0, self.bins - 1)
+        self.counts += np.bincount(idx, weights=weights, minlength=self.bins).astype(np.int64)
+
+    def _cover(self, vmin, vmax):
+        if self.lo is None:
+            if vmin == vmax:
+                self.lo, self.width = vmin - 0.5, 1.0 / self.bins
+            else:
+                self.lo, self.width = vmin, (vmax - vmin) / self.bins
+        while vmin < self.lo:
+            self._grow(downward=True)
+        # Tolerate round-off in lo + width * bins at the top edge
+        while vmax - self.hi > 1e-9 * self.width:
+            self._grow(downward=False)
+
+    def reserve(self, vmin, vmax) -> "StreamingHistogram":
+        """
+        Sizes the range for values known to lie in [vmin, vmax] (e.g. from
+        file statistics), so later updates never merge bins.
+        """
+        self._cover(float(vmin), float(vmax))
+        return self
+
+    def update(self, values) -> "StreamingHistogram":
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[np.isfinite(values)]
+        if len(values) == 0:
+            return self
+
+        self._cover(values.min(), values.max())
+        self._add(values)
+        return self
+
+    def merge(self, other: "StreamingHistogram") -> "StreamingHistogram":
+        merged = StreamingHistogram(bins=self.bins)
+        for hist in (self, other):
+            if hist.lo is None:
+                continue
+            # Re-bin each source bin at its centre
+            centers = hist.edges[:-1] + hist.width / 2
+            merged._cover(hist.lo, hist.hi)
+            merged._add(centers, weights=hist.counts)
+        return merged
+
+    def trimmed(self, max_bins=None):
+        """
+        Returns (edges, counts) without empty bins at either end, merging
+        adjacent bins so that at most max_bins remain.
+        """
+        nonzero = np.flatnonzero(self.counts)
+        if len(nonzero) == 0:
+            return self.edges, self.counts
+
+        first, last = nonzero[0], nonzero[-1] + 1
+        edges, counts = self.edges[first:last + 1], self.counts[first:last]
+
+        if max_bins and len(counts) > max_bins:
+            step = -(-len(counts) // max_bins)
+            counts = np.add.reduceat(counts, np.arange(0, len(counts), step))
+            edges = np.append(edges[:-1:step], edges[-1])
+
+        return edges, counts
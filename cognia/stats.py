@@ -1,23 +1,164 @@
+import numpy as np
 import pandas as pd
+from dataclasses import dataclass
 
-def numeric_summary(df: pd.DataFrame) -> pd.DataFrame:
+from .context import _get_context
+from .moments import Moments, _merge_moments, finalize_moments, moment_kernel
+from .sketches import QuantileSketch
+
+_SUMMARY_COLUMNS = [
+    "count", "mean", "std", "min", "25%", "50%", "75%", "max",
+    "skewness", "kurtosis"
+]
+
+def numeric_summary(df: pd.DataFrame, context=None, quantile_error=None) -> pd.DataFrame:
     """
     Returns descriptive statistics for numeric columns.
+
+    quantile_error switches the 25/50/75% rows to approximate quantiles
+    with that rank error (e.g. 0.005).
     """
-    if not isinstance(df, pd.DataFrame):
+    if context is None and not isinstance(df, pd.DataFrame):
         raise TypeError("Input must be a pandas DataFrame")
 
-    numeric_df = df.select_dtypes(include="number")
+    ctx = _get_context(df, context, quantile_error=quantile_error)
 
-    if numeric_df.empty:
+    if not ctx.numeric_columns or ctx.n_rows == 0:
         return pd.DataFrame()
 
-    summary = numeric_df.describe().T
-    summary["skewness"] = numeric_df.skew()
-    summary["kurtosis"] = numeric_df.kurt()
+    summary = ctx.numeric_table()[_SUMMARY_COLUMNS]
 
     return summary.round(3)
 
 
+# ---------------- Mergeable partial statistics ----------------
+
+def _empty_moments(n_columns) -> Moments:
+    zeros = np.zeros(n_columns)
+    return Moments(
+        zeros, zeros, zeros, zeros, zeros,
+        np.full(n_columns, np.inf), np.full(n_columns, -np.inf)
+    )
+
+
+@dataclass
+class NumericSummaryState:
+    """
+    Partial numeric statistics of one chunk or partition.
+
+    States are built per chunk with from_frame, combined with merge (in
+    any grouping) and turned into the numeric_summary table with finalize.
+    Exact quartiles cannot be merged: with quantile_error set, each column
+    also carries a mergeable quantile sketch that fills the quartile
+    columns, otherwise they are left empty.
+    """
+    columns: list
+    n_rows: int
+    null_count: np.ndarray
+    moments: Moments
+    sketches: list = None
+    quantile_error: float = None
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, quantile_error=None) -> "NumericSummaryState":
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("Input must be a pandas DataFrame")
+
+        numeric_df = df.select_dtypes(include="number")
+        values = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+        return cls.from_array(numeric_df.columns.tolist(), values, quantile_error)
+
+    @classmethod
+    def from_array(cls, columns, values: np.ndarray, quantile_error=None) -> "NumericSummaryState":
+        moments = moment_kernel(values)
+
+        sketches = None
+        if quantile_error is not None:
+            sketches = [
+                QuantileSketch.for_error(quantile_error).update(values[:, j])
+                for j in range(values.shape[1])
+            ]
+
+        return cls(
+            columns=list(columns),
+            n_rows=len(values),
+            null_count=len(values) - moments.count,
+            moments=moments,
+            sketches=sketches,
+            quantile_error=quantile_error
+        )
+
+    def _align(self, columns) -> "NumericSummaryState":
+        # Columns absent from this chunk count as missing for all its rows
+        if columns == self.columns:
+            return self
+
+        position = {col: i for i, col in enumerate(self.columns)}
+        empty = _empty_moments(1)
+        fields = [[] for _ in Moments._fields]
+        null_count = []
+        sketches = [] if self.sketches is not None else None
+
+        for col in columns:
+            i = position.get(col)
+            for field, values, blank in zip(fields, self.moments, empty):
+                field.append(values[i] if i is not None else blank[0])
+            null_count.append(self.null_count[i] if i is not None else self.n_rows)
+            if sketches is not None:
+                sketches.append(
+                    self.sketches[i] if i is not None
+                    else QuantileSketch.for_error(self.quantile_error)
+                )
+
+        return NumericSummaryState(
+            columns=list(columns),
+            n_rows=self.n_rows,
+            null_count=np.array(null_count, dtype=np.float64),
+            moments=Moments(*(np.array(f, dtype=np.float64) for f in fields)),
+            sketches=sketches,
+            quantile_error=self.quantile_error
+        )
+
+    def merge(self, other: "NumericSummaryState") -> "NumericSummaryState":
+        columns = self.columns + [c for c in other.columns if c not in self.columns]
+        left, right = self._align(columns), other._align(columns)
+
+        # Quartiles stay available only if both sides carry sketches
+        sketches = quantile_error = None
+        if left.sketches is not None and right.sketches is not None:
+            sketches = [a.merge(b) for a, b in zip(left.sketches, right.sketches)]
+            quantile_error = left.quantile_error
+
+        return NumericSummaryState(
+            columns=columns,
+            n_rows=left.n_rows + right.n_rows,
+            null_count=left.null_count + right.null_count,
+            moments=_merge_moments(left.moments, right.moments),
+            sketches=sketches,
+            quantile_error=quantile_error
+        )
+
+    def null_counts(self) -> pd.Series:
+        return pd.Series(self.null_count.astype(int), index=self.columns)
+
+    def quartiles(self) -> np.ndarray:
+        """
+        Returns a (3, n_columns) array of estimated Q1, median and Q3.
+        """
+        if self.sketches is None:
+            return np.full((3, len(self.columns)), np.nan)
+        return np.array(
+            [s.quantile([0.25, 0.5, 0.75]) for s in self.sketches]
+        ).reshape(-1, 3).T
+
+    def finalize(self) -> pd.DataFrame:
+        if not self.columns or self.n_rows == 0:
+            return pd.DataFrame()
 
+        stats = finalize_moments(self.moments)
+        summary = pd.DataFrame(index=self.columns, columns=_SUMMARY_COLUMNS, dtype=float)
+        for name in ["count", "mean", "std", "min", "max", "skewness", "kurtosis"]:
+            summary[name] = stats[name]
+        summary["25%"], summary["50%"], summary["75%"] = self.quartiles()
 
+        return summary.round(3)
@@ -0,0 +1,278 @@
+import numpy as np
+import pandas as pd
+
+from .context import ColumnProfile, ProfileContext, _numeric_profiles
+from .corr import CorrelationResult, CorrelationState
+from .interpret import interpret_distribution
+from .missing import missing_report
+from .moments import finalize_moments
+from .outliers import outlier_detect
+from .profiling import dataset_overview
+from .sketches import HyperLogLog, StreamingHistogram, TopKSketch
+from .stats import NumericSummaryState, numeric_summary
+from .alert import _generate_alerts
+
+
+class StreamingProfiler:
+    """
+    Profiles a table fed chunk by chunk with bounded memory.
+
+    Numeric columns keep mergeable moments and quantile sketches (see
+    NumericSummaryState) and a histogram; other columns keep a top-k value
+    sketch. Every column keeps a HyperLogLog distinct counter. Column types are
+    fixed by the first chunk: later chunks are coerced to them, so pass
+    explicit dtypes to the reader when the first chunk is not
+    representative.
+
+    ranges ({column: (min, max)}, e.g. from file statistics) sizes numeric
+    histograms up front. quantile_error cannot be None: quartiles and
+    outlier counts always come from the sketches.
+
+    Duplicate rows are counted from a HyperLogLog over row hashes, so the
+    count is exact up to 2 ** distinct_precision distinct rows and an
+    estimate beyond: data_quality() then flags it as estimated and reports
+    0 while the difference is within three standard errors of the distinct
+    row count, so unique rows don't show up as duplicates. exact_duplicates=True keeps every distinct row hash
+    instead (8 bytes per distinct row) for an exact count at any size; they
+    are kept as sorted runs that are merged like a binary counter, so an
+    update costs its batch times the log of the rows kept, not a copy of
+    them all.
+    """
+
+    def __init__(self, quantile_error=0.005, top_k=1000, bins=256, distinct_precision=14,
+                 ranges=None, exact_duplicates=False):
+        if quantile_error is None:
+            # Quartiles and outlier counts come from the quantile sketches
+            raise ValueError(
+                "StreamingProfiler needs a quantile_error: exact quantiles need all rows at once"
+            )
+        self.quantile_error = quantile_error
+        self.top_k = top_k
+        self.bins = bins
+        self.distinct_precision = distinct_precision
+        self.ranges = ranges or {}
+        self.exact_duplicates = exact_duplicates
+
+        self.n_rows = 0
+        self.dtypes = None
+        self.numeric_columns = []
+        self.categorical_columns = []
+        self.null_counts = None
+
+        self.numeric = None
+        self.histograms = {}
+        self.top_values = {}
+        self.distinct = {}
+        self.correlation = None
+        self.rows = None if exact_duplicates else HyperLogLog(distinct_precision)
+        self._row_runs = []
+
+    # ---------------- Accumulation ----------------
+
+    def _start(self, chunk: pd.DataFrame):
+        self.dtypes = chunk.dtypes
+        self.numeric_columns = chunk.select_dtypes(include="number").columns.tolist()
+        numeric = set(self.numeric_columns)
+        self.categorical_columns = [c for c in chunk.columns if c not in numeric]
+        self.null_counts = pd.Series(0, index=self.categorical_columns, dtype="int64")
+
+        self.histograms = {c: StreamingHistogram(bins=self.bins) for c in self.numeric_columns}
+        for col, (lo, hi) in self.ranges.items():
+            if col in self.histograms:
+                self.histograms[col].reserve(lo, hi)
+        self.top_values = {c: TopKSketch(capacity=self.top_k) for c in self.categorical_columns}
+        self.distinct = {c: HyperLogLog(self.distinct_precision) for c in chunk.columns}
+        self.correlation = CorrelationState(self.numeric_columns)
+
+    def _numeric_block(self, chunk: pd.DataFrame) -> np.ndarray:
+        block = chunk[self.numeric_columns]
+        for col in self.numeric_columns:
+            if not pd.api.types.is_numeric_dtype(block[col]):
+                block = block.assign(**{col: pd.to_numeric(block[col], errors="coerce")})
+        return block.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    def update(self, chunk: pd.DataFrame) -> "StreamingProfiler":
+        if not isinstance(chunk, pd.DataFrame):
+            raise TypeError("Input must be a pandas DataFrame")
+
+        if self.dtypes is None:
+            self._start(chunk)
+        chunk = chunk[list(self.dtypes.index)]
+
+        values = self._numeric_block(chunk)
+        state = NumericSummaryState.from_array(
+            self.numeric_columns, values, quantile_error=self.quantile_error
+        )
+        self.numeric = state if self.numeric is None else self.numeric.merge(state)
+
+        for j, col in enumerate(self.numeric_columns):
+            self.histograms[col].update(values[:, j])
+            self.distinct[col].update(values[:, j])
+        self.correlation.update(values)
+
+        for col in self.categorical_columns:
+            self.top_values[col].update(chunk[col])
+            self.distinct[col].update(chunk[col])
+
+        # Numeric null counts are tracked by the summary state
+        self.null_counts += chunk[self.categorical_columns].isnull().sum()
+
+        # Rows are hashed with numeric columns in their coerced float form so
+        # identical rows hash alike whatever dtype a chunk was parsed with;
+        # adding 0.0 turns -0.0 into 0.0
+        canonical = pd.DataFrame(values + 0.0, columns=self.numeric_columns, index=chunk.index)
+        canonical = pd.concat([canonical, chunk[self.categorical_columns]], axis=1)
+        hashes = pd.util.hash_pandas_object(canonical, index=False).to_numpy()
+        if self.exact_duplicates:
+            self._add_row_hashes(hashes)
+        else:
+            self.rows.update_hashes(hashes)
+
+        self.n_rows += len(chunk)
+        return self
+
+    def _add_row_hashes(self, hashes):
+        # Keeps hashes not in any run as a new run, then merges runs of
+        # similar size so there are at most log2(rows) of them
+        hashes = np.unique(hashes)
+        for run in self._row_runs:
+            pos = np.minimum(np.searchsorted(run, hashes), len(run) - 1)
+            hashes = hashes[run[pos] != hashes]
+        if len(hashes):
+            self._row_runs.append(hashes)
+
+        runs = self._row_runs
+        while len(runs) > 1 and len(runs[-2]) <= 2 * len(runs[-1]):
+            last = runs.pop()
+            runs[-1] = np.sort(np.concatenate([runs[-1], last]))
+
+    # ---------------- Results ----------------
+
+    def _outlier_counts(self, q1, q3):
+        counts = np.zeros(len(self.numeric_columns))
+        for j, sketch in enumerate(self.numeric.sketches):
+            iqr = q3[j] - q1[j]
+            if iqr == 0 or np.isnan(iqr):
+                continue
+            counts[j] = sketch.outlier_count(q1[j] - 1.5 * iqr, q3[j] + 1.5 * iqr)
+        return np.round(counts)
+
+    def profiles(self) -> list:
+        """
+        Returns ColumnProfiles for every column, in the original order.
+        """
+        if self.dtypes is None:
+            return []
+
+        stats = finalize_moments(self.numeric.moments)
+        quartiles = self.numeric.quartiles()
+
+        numeric = _numeric_profiles(
+            self.numeric_columns,
+            [self.dtypes[c] for c in self.numeric_columns],
+            self.n_rows,
+            stats,
+            quartiles,
+            self._outlier_counts(quartiles[0], quartiles[2])
+        )
+
+        for profile in numeric:
+            profile.n_distinct = self.distinct[profile.name].count()
+
+        by_name = {p.name: p for p in numeric}
+        for col in self.categorical_columns:
+            sketch = self.top_values[col]
+            count = self.n_rows - int(self.null_counts[col])
+            by_name[col] = ColumnProfile(
+                name=col,
+                dtype=str(self.dtypes[col]),
+                is_numeric=False,
+                count=count,
+                null_count=int(self.null_counts[col]),
+                value_counts=sketch.top(sketch.capacity),
+                n_distinct=self.distinct[col].count()
+            )
+
+        return [by_name[col] for col in self.dtypes.index]
+
+    def chart_data(self) -> tuple:
+        """
+        Report chart data: top 10 values of categorical columns and
+        30-bin histograms of numeric columns.
+        """
+        categorical = {}
+        numeric = {}
+
+        for col, sketch in self.top_values.items():
+            counts = sketch.top(10)
+            if counts.empty or counts.nunique() <= 1:
+                continue
+            categorical[col] = counts
+
+        for col, hist in self.histograms.items():
+            if hist.lo is None:
+                continue
+            numeric[col] = hist.trimmed(max_bins=30)
+
+        return categorical, numeric
+
+    def context(self) -> ProfileContext:
+        return ProfileContext.from_profiles(self.profiles(), n_rows=self.n_rows)
+
+    def sections(self) -> dict:
+        """
+        Returns the quick_eda sections computed from the accumulated state.
+        """
+        return _profile_sections(
+            self.context(), self.correlation.matrix(), self.data_quality()
+        )
+
+    def data_quality(self) -> dict:
+        if self.exact_duplicates:
+            distinct, error = sum(len(run) for run in self._row_runs), 0.0
+        else:
+            distinct, error = self.rows.count(), self.rows.relative_error
+        duplicates = self.n_rows - distinct
+        if duplicates <= 3 * error * distinct:
+            duplicates = 0
+        return {
+            "duplicate_records": duplicates,
+            "duplicate_percent": round(duplicates / self.n_rows * 100, 2) if self.n_rows else 0.0,
+            "duplicates_estimated": error > 0,
+            "numeric_count": len(self.numeric_columns),
+            "categorical_count": len(self.categorical_columns),
+        }
+
+
+def _profile_sections(ctx, correlation, data_quality) -> dict:
+    """
+    Report sections from a context built on precomputed profiles, the
+    numeric correlation matrix and the data quality summary.
+    """
+    stats = numeric_summary(None, context=ctx)
+    missing = missing_report(None, context=ctx)
+    outliers = outlier_detect(None, context=ctx)
+    corr = CorrelationResult("pearson", matrix=correlation)
+
+    return {
+        "overview": dataset_overview(None, context=ctx),
+        "missing": missing,
+        "statistics": stats,
+        "outliers": outliers,
+        "interpretation": interpret_distribution(stats),
+        "alerts": _generate_alerts(None, stats, outliers, missing, context=ctx),
+        "correlation": {
+            "top_pairs": corr.top_pairs(),
+            "full_correlation_heatmap": corr.heatmap()
+        },
+        "data_quality": data_quality
+    }
+
+
+def profile(df: pd.DataFrame, **options) -> StreamingProfiler:
+    """
+    Profiles a DataFrame into a StreamingProfiler that later batches of
+    rows can be folded into with update(); eda_report(profile) renders
+    the report from the accumulated state without the data.
+    """
+    return StreamingProfiler(**options).update(df)
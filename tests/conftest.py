@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def mixed_frame():
+    """
+    Numeric columns of several shapes (with missing values, a constant and
+    an integer column) next to string and categorical columns.
+    """
+    rng = np.random.default_rng(0)
+    n = 2000
+    frame = pd.DataFrame({
+        "normal": rng.normal(10, 2, n),
+        "skewed": rng.lognormal(0, 1, n),
+        "count": rng.integers(0, 50, n),
+        "constant": np.full(n, 3.0),
+        "city": rng.choice(["Oslo", "Lima", "Pune", "Kyiv"], n),
+        "grade": pd.Categorical(rng.choice(list("abc"), n), categories=list("abcd")),
+    })
+    frame.loc[rng.choice(n, 150, replace=False), "normal"] = np.nan
+    frame.loc[rng.choice(n, 40, replace=False), "city"] = None
+    return frame
+
+
+# ---------------- Baseline references ----------------
+# The per-column pandas computations Cognia's vectorized paths replace
+
+def baseline_summary(df: pd.DataFrame) -> pd.DataFrame:
+    numeric_df = df.select_dtypes(include="number")
+    summary = numeric_df.describe().T
+    summary["skewness"] = numeric_df.skew()
+    summary["kurtosis"] = numeric_df.kurt()
+    return summary.round(3)
+
+
+def baseline_outliers(df: pd.DataFrame) -> pd.DataFrame:
+    rows = []
+    for col in df.select_dtypes(include="number").columns:
+        series = df[col].dropna()
+        if series.empty:
+            continue
+        q1, q3 = series.quantile(0.25), series.quantile(0.75)
+        iqr = q3 - q1
+        count = 0 if iqr == 0 else int(((series < q1 - 1.5 * iqr) | (series > q3 + 1.5 * iqr)).sum())
+        rows.append({
+            "column": col,
+            "outlier_count": count,
+            "outlier_percent": round(count / len(series) * 100, 2)
+        })
+    return pd.DataFrame(rows)
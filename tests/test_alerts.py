@@ -0,0 +1,42 @@
+import dataclasses
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cognia import alert_rules, quick_eda, register_alert_rule
+from cognia.alert import _RULES
+from cognia.scheduler import Stage, run_stages
+
+
+@pytest.fixture
+def restore_rules():
+    rules = alert_rules()
+    yield
+    _RULES[:] = rules
+
+
+def _skew_alerts(frame):
+    return [a for a in quick_eda(frame)["alerts"] if "skew" in a]
+
+
+def test_skew_alerts_split_at_severe_threshold(restore_rules):
+    frame = pd.DataFrame({"a": np.random.default_rng(0).lognormal(0, 1.1, 1000)})
+    assert _skew_alerts(frame) == ["a is severely right-skewed (skew = 4.51)"]
+
+    severe = next(r for r in alert_rules() if r.name == "severe_skew")
+    register_alert_rule(dataclasses.replace(severe, threshold=10))
+    assert _skew_alerts(frame) == ["a has moderate skewness (skew = 4.51)"]
+
+
+def _pid(*args):
+    return os.getpid()
+
+
+def test_local_stages_run_in_the_caller():
+    stages = [Stage("worker", _pid), Stage("local", _pid, local=True)]
+    result = run_stages(stages, n_jobs=2, backend="process")
+
+    assert result["local"] == os.getpid()
+    assert result["worker"] != os.getpid()
@@ -0,0 +1,87 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cognia import (
+    AlertRule,
+    ProfileContext,
+    ResultCache,
+    column_fingerprint,
+    eda_report,
+    numeric_summary,
+    register_alert_rule,
+    table_fingerprint,
+    unregister_alert_rule
+)
+
+
+# ---------------- Fingerprints ----------------
+
+def test_fingerprint_tracks_name_dtype_and_values():
+    series = pd.Series([1.0, 2.0, 3.0], name="x")
+
+    assert column_fingerprint(series) == column_fingerprint(series.copy())
+    assert column_fingerprint(series) != column_fingerprint(series.rename("y"))
+    assert column_fingerprint(series) != column_fingerprint(series.astype("float32"))
+    assert column_fingerprint(series) != column_fingerprint(series.replace(3.0, 4.0))
+
+    text = pd.Series(["a", "b"], name="s")
+    assert column_fingerprint(text) != column_fingerprint(pd.Series(["a", "c"], name="s"))
+
+
+def test_table_fingerprint_changes_only_for_changed_columns(mixed_frame):
+    before = dict(table_fingerprint(mixed_frame))
+    after = dict(table_fingerprint(mixed_frame.assign(skewed=mixed_frame["skewed"] + 1)))
+
+    assert [col for col in before if before[col] != after[col]] == ["skewed"]
+
+
+# ---------------- Result cache ----------------
+
+def test_changed_column_is_recomputed(mixed_frame, tmp_path):
+    cache = ResultCache(tmp_path)
+    first = ProfileContext(mixed_frame, cache=cache)
+    numeric_summary(mixed_frame, context=first)
+
+    changed = mixed_frame.assign(skewed=mixed_frame["skewed"] * 3)
+    ctx = ProfileContext(changed, cache=cache)
+    stored = {col: cache.get(ctx._column_key(col, "profile")) for col in ctx.numeric_columns}
+
+    assert stored["skewed"] is None
+    assert all(stored[col] is not None for col in ("normal", "count", "constant"))
+
+    pd.testing.assert_frame_equal(
+        numeric_summary(changed, context=ctx), numeric_summary(changed)
+    )
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ResultCache(tmp_path, max_size=3000)
+    for i in range(5):
+        cache.put(("entry", i), np.zeros(100))
+        cache.get(("entry", 0))
+
+    assert cache.get(("entry", 0)) is not None
+    assert cache.get(("entry", 1)) is None
+    assert cache.get(("entry", 4)) is not None
+
+    cache.clear()
+    assert cache.get(("entry", 4)) is None
+
+
+def test_cached_report_follows_alert_rules(mixed_frame, tmp_path):
+    output = tmp_path / "report.html"
+
+    def alerts():
+        eda_report(mixed_frame, output_file=str(output), cache=str(tmp_path / "cache"))
+        return re.findall(r"CUSTOM (\w+)", output.read_text(encoding="utf-8"))
+
+    assert alerts() == []
+    register_alert_rule(AlertRule("custom", lambda t, th: t["is_numeric"], "CUSTOM {column}"))
+    try:
+        assert alerts() == ["normal", "skewed", "count", "constant"]
+    finally:
+        unregister_alert_rule("custom")
+    assert alerts() == []
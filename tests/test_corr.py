@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cognia import ProfileContext, correlation_result, top_correlated_pairs
+from cognia.corr import blocked_correlation
+
+
+def _baseline_pairs(df, threshold=0.6, top_n=10):
+    corr = df.select_dtypes(include="number").corr().abs()
+    upper = corr.where(np.triu(np.ones(corr.shape), k=1).astype(bool))
+    pairs = (
+        upper.stack()
+        .reset_index()
+        .rename(columns={"level_0": "Feature 1", "level_1": "Feature 2", 0: "Correlation"})
+        .sort_values("Correlation", ascending=False)
+    )
+    return pairs[pairs["Correlation"] >= threshold].head(top_n)
+
+
+@pytest.fixture
+def correlated():
+    rng = np.random.default_rng(0)
+    base = rng.normal(size=(3000, 6))
+    columns = {}
+    for j in range(30):
+        # Columns share one of six latent factors with varying noise
+        columns[f"c{j}"] = base[:, j % 6] + rng.normal(scale=0.2 + j / 20, size=3000)
+    frame = pd.DataFrame(columns)
+    frame.iloc[rng.choice(3000, 300, replace=False), 4] = np.nan
+    frame["label"] = "x"
+    return frame
+
+
+def _pair_set(pairs):
+    return {
+        (frozenset((a, b)), round(c, 9))
+        for a, b, c in pairs[["Feature 1", "Feature 2", "Correlation"]].itertuples(index=False)
+    }
+
+
+def test_top_pairs_match_baseline(correlated):
+    assert len(_baseline_pairs(correlated)) == 10
+    assert _pair_set(top_correlated_pairs(correlated)) == _pair_set(_baseline_pairs(correlated))
+
+
+@pytest.mark.parametrize("n_jobs", [1, 3])
+def test_blocked_correlation_matches_dense(correlated, n_jobs):
+    blocked = blocked_correlation(correlated, memory_limit="64KB", n_jobs=n_jobs)
+    assert _pair_set(blocked["top_pairs"]) == _pair_set(_baseline_pairs(correlated))
+
+    dense = correlated.select_dtypes(include="number").corr()
+    np.testing.assert_allclose(blocked["heatmap"].to_numpy(), dense.to_numpy(), atol=1e-9)
+
+
+def test_context_memory_limit_and_n_jobs(correlated):
+    ctx = ProfileContext(correlated, memory_limit="64KB", n_jobs=2)
+    result = correlation_result(correlated, context=ctx)
+
+    assert result.matrix is None
+    assert _pair_set(result.top_pairs()) == _pair_set(_baseline_pairs(correlated))
+    with pytest.raises(ValueError):
+        result.top_pairs(threshold=0.9)
@@ -0,0 +1,52 @@
+import io
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cognia import eda_tables, export_json, export_parquet, quick_eda
+
+
+def _strict_json(text):
+    def reject(constant):
+        raise ValueError(f"invalid JSON constant {constant}")
+    return json.loads(text, parse_constant=reject)
+
+
+@pytest.fixture
+def labelled_frame():
+    # Mixed int and str labels, and infinite values
+    return pd.DataFrame({
+        0: [1.0, np.inf, 3.0, 4.0, 5.0],
+        "b": [1.0, 2.0, -np.inf, 5.0, 2.0],
+        "c": list("xyxyz"),
+    })
+
+
+def test_json_export_is_valid_with_infinities(labelled_frame):
+    buffer = io.StringIO()
+    export_json(quick_eda(labelled_frame), buffer, profile_id="run-1")
+    data = _strict_json(buffer.getvalue())
+
+    assert data["profile_id"] == "run-1"
+    statistics = {row["column"]: row for row in data["statistics"]}
+    assert statistics[0]["max"] is None and statistics["b"]["min"] is None
+
+
+def test_tables_cover_sections(mixed_frame):
+    tables = eda_tables(quick_eda(mixed_frame))
+    assert set(tables) == {
+        "summary", "column_overview", "missing", "statistics",
+        "outliers", "interpretation", "alerts", "correlation"
+    }
+    assert tables["summary"]["rows"].iloc[0] == len(mixed_frame)
+
+
+def test_parquet_export_with_mixed_labels(labelled_frame, tmp_path):
+    pytest.importorskip("pyarrow")
+    export_parquet(quick_eda(labelled_frame), tmp_path, profile_id="run-1")
+
+    statistics = pd.read_parquet(tmp_path / "statistics.parquet")
+    assert statistics["column"].tolist() == ["0", "b"]
+    assert (statistics["profile_id"] == "run-1").all()
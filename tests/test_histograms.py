@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cognia import compute_histograms
+
+
+@pytest.mark.parametrize("bins", [10, 30, 257])
+def test_histograms_match_numpy(mixed_frame, bins):
+    result = compute_histograms(mixed_frame, bins=bins)
+
+    for col in ("normal", "skewed", "count", "constant"):
+        values = mixed_frame[col].dropna().to_numpy(dtype=float)
+        counts, edges = np.histogram(values, bins=bins)
+        np.testing.assert_array_equal(result[col].counts, counts, err_msg=col)
+        np.testing.assert_allclose(result[col].edges, edges, err_msg=col)
+
+
+def test_all_missing_columns_are_left_out():
+    frame = pd.DataFrame({"x": [1.0, 2.0], "y": [np.nan, np.nan]})
+    assert list(compute_histograms(frame)) == ["x"]
+
+
+def test_infinite_values_keep_fixed_bins():
+    values = np.r_[np.arange(1000.0), np.inf, -np.inf]
+    frame = pd.DataFrame({"with_inf": values, "finite": np.arange(1002.0)})
+
+    fixed = compute_histograms(frame, bins=500)
+    assert len(fixed["with_inf"].counts) == len(fixed["finite"].counts) == 500
+    assert fixed["with_inf"].counts.sum() == 1000
+
+    automatic = compute_histograms(frame, bins="fd")
+    assert len(automatic["with_inf"].counts) <= 256
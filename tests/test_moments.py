@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cognia import NumericSummaryState
+from cognia.moments import finalize_moments, moment_kernel
+
+
+def _pandas_stats(values: np.ndarray) -> dict:
+    frame = pd.DataFrame(values)
+    return {
+        "count": frame.count().to_numpy(dtype=float),
+        "mean": frame.mean().to_numpy(),
+        "std": frame.std().to_numpy(),
+        "skewness": frame.skew().to_numpy(),
+        "kurtosis": frame.kurt().to_numpy(),
+    }
+
+
+def test_moment_kernel_matches_pandas_across_blocks():
+    rng = np.random.default_rng(1)
+    values = np.column_stack([
+        rng.normal(5, 3, 10_000), rng.exponential(2, 10_000), rng.integers(0, 9, 10_000)
+    ]).astype(float)
+    values[rng.random(values.shape) < 0.05] = np.nan
+
+    stats = finalize_moments(moment_kernel(values, block_rows=777))
+    for field, expected in _pandas_stats(values).items():
+        np.testing.assert_allclose(stats[field], expected, rtol=1e-9, err_msg=field)
+
+
+def test_constant_and_short_columns():
+    values = np.array([[2.0, 1.0], [2.0, np.nan], [2.0, np.nan]])
+    stats = finalize_moments(moment_kernel(values))
+
+    assert stats["std"][0] == 0 and stats["skewness"][0] == 0
+    assert np.isnan(stats["std"][1]) and np.isnan(stats["skewness"][1])
+
+
+@pytest.mark.parametrize("quantile_error", [None, 0.01])
+def test_merged_states_match_whole_frame(quantile_error):
+    rng = np.random.default_rng(2)
+    frame = pd.DataFrame({"a": rng.normal(size=3000), "b": rng.gamma(2, size=3000)})
+    whole = NumericSummaryState.from_frame(frame, quantile_error=quantile_error)
+
+    parts = [NumericSummaryState.from_frame(frame.iloc[start:start + 430], quantile_error=quantile_error)
+             for start in range(0, 3000, 430)]
+    # Merges may be grouped in any order
+    merged = parts[0].merge(parts[1]).merge(parts[2].merge(parts[3].merge(parts[4])))
+    merged = merged.merge(parts[5].merge(parts[6]))
+
+    left, right = finalize_moments(whole.moments), finalize_moments(merged.moments)
+    for field in ("count", "mean", "std", "min", "max", "skewness", "kurtosis"):
+        np.testing.assert_allclose(left[field], right[field], rtol=1e-9, err_msg=field)
+
+
+def test_merge_with_chunks_without_numeric_columns():
+    rng = np.random.default_rng(3)
+    numbers = pd.DataFrame({"x": rng.normal(size=500)})
+    text = pd.DataFrame({"s": ["a"] * 200})
+
+    for quantile_error in (None, 0.01):
+        a = NumericSummaryState.from_frame(text, quantile_error=quantile_error)
+        b = NumericSummaryState.from_frame(numbers, quantile_error=quantile_error)
+        for merged in (a.merge(b), b.merge(a)):
+            assert merged.columns == ["x"]
+            assert merged.null_counts()["x"] == 200
+            np.testing.assert_allclose(
+                finalize_moments(merged.moments)["mean"], [numbers["x"].mean()]
+            )
+
+
+def test_merge_with_empty_chunk():
+    frame = pd.DataFrame({"x": [1.0, 2.0, 4.0, 8.0]})
+    empty = NumericSummaryState.from_frame(frame.iloc[:0], quantile_error=0.01)
+    full = NumericSummaryState.from_frame(frame, quantile_error=0.01)
+
+    merged = empty.merge(full)
+    stats = finalize_moments(merged.moments)
+    assert stats["count"][0] == 4
+    assert stats["mean"][0] == pytest.approx(3.75)
+    np.testing.assert_allclose(merged.quartiles()[:, 0], frame["x"].quantile([0.25, 0.5, 0.75]))
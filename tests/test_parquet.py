@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cognia import eda_report, profile
+
+pytest.importorskip("pyarrow")
+
+from cognia.parquet import parquet_batches  # noqa: E402
+
+
+@pytest.fixture
+def parquet_dir(tmp_path):
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({
+        "x": rng.normal(size=3000),
+        "n": rng.integers(0, 100, 3000),
+        "s": rng.choice(list("abc"), 3000),
+        "empty": np.full(3000, np.nan),
+        "part": np.repeat(["p1", "p2", "p3"], 1000),
+    })
+    frame.loc[::7, "x"] = np.nan
+    frame.to_parquet(tmp_path / "data", partition_cols=["part"], row_group_size=400)
+    return tmp_path / "data", frame
+
+
+def test_footer_statistics(parquet_dir):
+    path, frame = parquet_dir
+    columns, stats, batches = parquet_batches(path, columns=["x", "n", "empty", "part"])
+
+    assert stats["n_rows"] == len(frame)
+    assert stats["null_counts"]["x"] == frame["x"].isna().sum()
+    assert stats["null_counts"]["empty"] == len(frame)
+    assert "part" not in stats["null_counts"]
+    assert stats["ranges"]["n"] == (frame["n"].min(), frame["n"].max())
+
+    read = pd.concat(list(batches))
+    assert list(read.columns) == columns
+    assert len(read) == len(frame) and read["empty"].isna().all()
+
+
+def test_batches_profile_like_the_frame(parquet_dir):
+    path, frame = parquet_dir
+    columns, _, batches = parquet_batches(path, columns=["x", "n", "s"], batch_size=500)
+
+    streamed = profile(next(batches))
+    for batch in batches:
+        streamed.update(batch)
+    whole = profile(frame[["x", "n", "s"]])
+
+    for a, b in zip(streamed.profiles(), whole.profiles()):
+        assert a.count == b.count and a.null_count == b.null_count
+        if a.is_numeric:
+            assert a.mean == pytest.approx(b.mean)
+
+
+def test_report_options(parquet_dir, tmp_path):
+    path, _ = parquet_dir
+    output = str(tmp_path / "report.html")
+
+    eda_report(path, output_file=output, columns=["x", "s"], top_k=2)
+    with pytest.raises(ValueError, match="memory_limit"):
+        eda_report(path, output_file=output, memory_limit="1GB")
+    with pytest.raises(KeyError):
+        eda_report(path, output_file=output, columns=["missing"])
@@ -0,0 +1,99 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cognia import (
+    ProfileContext,
+    compute_histograms,
+    diff_profiles,
+    load_profile,
+    profile,
+    save_profile
+)
+from cognia.persist import FORMAT_VERSION
+
+
+def _strict_json(text):
+    def reject(constant):
+        raise ValueError(f"invalid JSON constant {constant}")
+    return json.loads(text, parse_constant=reject)
+
+
+def test_round_trip_matches_profiles(mixed_frame, tmp_path):
+    path = tmp_path / "frame.npz"
+    save_profile(mixed_frame, path)
+    saved = load_profile(path)
+
+    assert isinstance(saved.arrays["numeric"], np.memmap)
+    assert saved.n_rows == len(mixed_frame)
+
+    ctx = ProfileContext(mixed_frame)
+    for loaded in saved.profiles():
+        original = ctx.profile(loaded.name)
+        assert loaded.count == original.count
+        assert loaded.null_count == original.null_count
+        assert loaded.n_unique == mixed_frame[loaded.name].nunique()
+        if loaded.is_numeric:
+            for field in ("mean", "std", "min", "q1", "median", "q3", "max", "outlier_count"):
+                assert getattr(loaded, field) == pytest.approx(getattr(original, field)), field
+        else:
+            assert loaded.value_counts.to_dict() == original.value_counts.to_dict()
+
+    expected = compute_histograms(mixed_frame, bins=30)
+    for col, hist in saved.histograms().items():
+        np.testing.assert_array_equal(hist.counts, expected[col].counts)
+        np.testing.assert_allclose(hist.edges, expected[col].edges)
+
+    dense = mixed_frame.select_dtypes(include="number").corr()
+    np.testing.assert_allclose(saved.correlation().to_numpy(), dense.to_numpy(), atol=1e-6)
+
+
+def test_round_trip_of_streaming_profile(mixed_frame, tmp_path):
+    profiler = profile(mixed_frame)
+    save_profile(profiler, tmp_path / "stream.npz")
+    saved = load_profile(tmp_path / "stream.npz")
+
+    assert [p.name for p in saved.profiles()] == list(mixed_frame.columns)
+    assert saved.meta["data_quality"] == profiler.data_quality()
+    assert diff_profiles(profiler, saved).empty
+
+
+def test_to_json_writes_non_finite_values_as_null(tmp_path):
+    frame = pd.DataFrame({"a": [1.0, np.inf, 3.0], "b": [-np.inf, 1.0, 2.0]})
+    save_profile(frame, tmp_path / "inf.npz")
+
+    data = _strict_json(load_profile(tmp_path / "inf.npz").to_json())
+    columns = {c["name"]: c for c in data["columns"]}
+    assert columns["a"]["max"] is None
+    assert columns["b"]["min"] is None
+
+
+def test_newer_format_is_rejected(tmp_path, monkeypatch):
+    import cognia.persist
+
+    monkeypatch.setattr(cognia.persist, "FORMAT_VERSION", FORMAT_VERSION + 1)
+    save_profile(pd.DataFrame({"x": [1.0]}), tmp_path / "new.npz")
+    monkeypatch.setattr(cognia.persist, "FORMAT_VERSION", FORMAT_VERSION)
+
+    with pytest.raises(ValueError):
+        load_profile(tmp_path / "new.npz")
+
+
+# ---------------- Comparison ----------------
+
+def test_diff_ignores_rounding():
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({"a": rng.normal(size=5000), "s": rng.choice(list("xyz"), 5000)})
+    assert diff_profiles(profile(frame), profile(frame.iloc[::-1])).empty
+
+
+def test_diff_reports_changes():
+    frame = pd.DataFrame({"a": np.arange(100.0), "b": np.ones(100)})
+    changed = frame.assign(a=frame["a"] * 2).drop(columns="b").assign(c=1.0)
+    diff = diff_profiles(profile(frame), profile(changed))
+
+    rows = set(zip(diff["column"], diff["statistic"]))
+    assert {("a", "mean"), ("a", "max"), ("c", "column"), ("b", "column")} <= rows
+    assert ("a", "count") not in rows
@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cognia import (
+    ProfileContext,
+    dataset_overview,
+    duplicate_summary,
+    missing_report,
+    numeric_summary,
+    outlier_detect,
+    quick_eda
+)
+from conftest import baseline_outliers, baseline_summary
+
+
+# ---------------- Parity with pandas ----------------
+
+def test_numeric_summary_matches_baseline(mixed_frame):
+    pd.testing.assert_frame_equal(
+        numeric_summary(mixed_frame), baseline_summary(mixed_frame), check_dtype=False
+    )
+
+
+def test_outliers_match_baseline(mixed_frame):
+    pd.testing.assert_frame_equal(
+        outlier_detect(mixed_frame).reset_index(drop=True),
+        baseline_outliers(mixed_frame),
+        check_dtype=False
+    )
+
+
+def test_missing_report_matches_pandas(mixed_frame):
+    report = missing_report(mixed_frame)
+    total = mixed_frame.isnull().sum()
+    pd.testing.assert_series_equal(
+        report["missing_count"].sort_index(), total.sort_index(), check_names=False
+    )
+    assert report["missing_percent"].is_monotonic_decreasing
+
+
+def test_approximate_quartiles_close_to_exact(mixed_frame):
+    exact = numeric_summary(mixed_frame)
+    approx = numeric_summary(mixed_frame, quantile_error=0.005)
+    for col in ("normal", "skewed"):
+        values = mixed_frame[col].dropna()
+        for q, field in zip((0.25, 0.5, 0.75), ("25%", "50%", "75%")):
+            rank = (values < approx.loc[col, field]).mean()
+            assert abs(rank - q) < 0.01
+    pd.testing.assert_series_equal(exact["mean"], approx["mean"])
+
+
+# ---------------- Distinct counts ----------------
+
+def test_distinct_counts_match_nunique(mixed_frame):
+    ctx = ProfileContext(mixed_frame)
+    expected = mixed_frame.nunique()
+    # Unused categories are not values of the column
+    assert expected["grade"] == 3
+    pd.testing.assert_series_equal(ctx.distinct_counts(), expected, check_dtype=False)
+
+    overview = dataset_overview(mixed_frame)["column_overview"]
+    assert overview["distinct"].tolist() == expected.tolist()
+
+
+def test_unused_categories_are_not_constant():
+    frame = pd.DataFrame({"c": pd.Categorical(["x"] * 10, categories=["x", "y", "z"])})
+    ctx = ProfileContext(frame)
+    assert ctx.profile("c").n_unique == 1
+    assert ctx.distinct_counts()["c"] == 1
+
+
+def test_distinct_precision_estimates_large_columns():
+    n = 50_000
+    frame = pd.DataFrame({
+        "id": [f"user-{i}" for i in range(n)],
+        "x": np.arange(n, dtype=float)
+    })
+    ctx = ProfileContext(frame, distinct_precision=10)
+    counts = ctx.distinct_counts()
+
+    for col in frame.columns:
+        assert abs(counts[col] - n) <= 4 * 1.04 / 2 ** 5 * n
+    assert set(ctx.distinct_sketches) == {"id", "x"}
+
+    small = ProfileContext(frame.head(500), distinct_precision=10)
+    assert small.distinct_counts().tolist() == [500, 500]
+
+
+def test_overview_does_not_scan_numeric_profiles():
+    frame = pd.DataFrame({"x": np.arange(100.0), "s": ["a", "b"] * 50})
+    ctx = ProfileContext(frame)
+    dataset_overview(frame, context=ctx)
+    assert "x" not in ctx._profiles
+
+
+# ---------------- Duplicates ----------------
+
+@pytest.mark.parametrize("with_context", [False, True])
+def test_duplicates_match_pandas(mixed_frame, with_context):
+    frame = pd.concat([mixed_frame, mixed_frame.iloc[:37]], ignore_index=True)
+    context = ProfileContext(frame) if with_context else None
+    result = duplicate_summary(frame, context=context)
+
+    assert result["duplicate_records"] == frame.duplicated().sum() == 37
+
+
+@pytest.mark.parametrize("with_context", [False, True])
+def test_signed_zeros_are_duplicates(with_context):
+    frame = pd.DataFrame({"a": [0.0, -0.0, np.nan, np.nan, 1.0], "b": ["x", "x", None, None, "y"]})
+    context = ProfileContext(frame) if with_context else None
+    assert duplicate_summary(frame, context=context)["duplicate_records"] == frame.duplicated().sum() == 2
+
+
+# ---------------- Edge cases ----------------
+
+def test_zero_row_frame(mixed_frame):
+    empty = mixed_frame.iloc[:0]
+
+    assert outlier_detect(empty).empty
+    overview = dataset_overview(empty)
+    assert overview["rows"] == 0
+    assert overview["column_overview"]["distinct"].tolist() == [0] * empty.shape[1]
+
+    result = quick_eda(empty)
+    assert result["statistics"].empty
+    assert result["alerts"] == []
+
+
+def test_parallel_sections_match_sequential(mixed_frame):
+    sequential = quick_eda(mixed_frame)
+    threaded = quick_eda(mixed_frame, n_jobs=4)
+
+    for name in ("missing", "statistics", "outliers", "interpretation"):
+        pd.testing.assert_frame_equal(sequential[name], threaded[name])
+    assert sequential["alerts"] == threaded["alerts"]
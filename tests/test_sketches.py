@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cognia.sketches import HyperLogLog, QuantileSketch, TopKSketch
+
+
+# ---------------- KLL quantiles ----------------
+
+def _rank_error(values, estimates, qs):
+    ranks = np.searchsorted(np.sort(values), estimates) / len(values)
+    return np.abs(ranks - qs).max()
+
+
+def test_quantile_sketch_exact_while_small():
+    values = np.random.default_rng(0).normal(size=150)
+    sketch = QuantileSketch(k=200).update(values)
+
+    assert sketch.is_exact
+    np.testing.assert_allclose(sketch.quantile([0.25, 0.5, 0.75]), np.quantile(values, [0.25, 0.5, 0.75]))
+
+
+@pytest.mark.parametrize("error", [0.01, 0.005])
+def test_quantile_sketch_rank_error(error):
+    values = np.random.default_rng(1).lognormal(size=300_000)
+    qs = np.linspace(0.01, 0.99, 99)
+
+    whole = QuantileSketch.for_error(error).update(values)
+    chunked = QuantileSketch.for_error(error)
+    for chunk in np.array_split(values, 40):
+        chunked.update(chunk)
+
+    assert not whole.is_exact
+    for sketch in (whole, chunked):
+        assert sketch.n == len(values)
+        assert _rank_error(values, sketch.quantile(qs), qs) < 2 * error
+    assert whole.min == values.min() and whole.max == values.max()
+
+
+def test_quantile_sketch_merge_and_missing_values():
+    rng = np.random.default_rng(2)
+    a, b = rng.normal(size=50_000), rng.normal(3, 1, 80_000)
+    a[::10] = np.nan
+    qs = np.array([0.1, 0.5, 0.9])
+
+    merged = QuantileSketch.for_error(0.01).update(a).merge(QuantileSketch.for_error(0.01).update(b))
+    values = np.concatenate([a[~np.isnan(a)], b])
+
+    assert merged.n == len(values)
+    assert _rank_error(values, merged.quantile(qs), qs) < 0.02
+
+
+def test_quantile_sketch_outlier_count():
+    values = np.random.default_rng(3).standard_t(3, size=200_000)
+    sketch = QuantileSketch.for_error(0.005).update(values)
+
+    expected = ((values < -3) | (values > 3)).sum()
+    assert sketch.outlier_count(-3, 3) == pytest.approx(expected, abs=0.01 * len(values))
+
+
+def test_empty_quantile_sketch():
+    sketch = QuantileSketch().update(np.array([np.nan, np.nan]))
+    assert sketch.n == 0
+    assert np.isnan(sketch.quantile([0.5])).all()
+    assert sketch.outlier_count(0, 1) == 0
+
+
+# ---------------- HyperLogLog ----------------
+
+def test_hyperloglog_exact_below_limit():
+    values = pd.Series(np.arange(5000) % 1234).astype(str)
+    counter = HyperLogLog(14).update(values)
+
+    assert counter.is_exact
+    assert counter.relative_error == 0
+    assert counter.count() == values.nunique()
+
+
+@pytest.mark.parametrize("precision", [10, 14])
+def test_hyperloglog_estimate_within_error(precision):
+    values = pd.Series(np.random.default_rng(4).integers(0, 2 ** 40, 400_000))
+    counter = HyperLogLog(precision)
+    for chunk in np.array_split(values.to_numpy(), 9):
+        counter.update(chunk)
+
+    true = values.nunique()
+    assert not counter.is_exact
+    assert abs(counter.count() - true) <= 4 * counter.relative_error * true
+
+
+def test_hyperloglog_merge_matches_union():
+    rng = np.random.default_rng(5)
+    a = pd.Series(rng.integers(0, 300_000, 200_000))
+    b = pd.Series(rng.integers(150_000, 450_000, 200_000))
+
+    merged = HyperLogLog(12).update(a).merge(HyperLogLog(12).update(b))
+    true = pd.concat([a, b]).nunique()
+    assert abs(merged.count() - true) <= 4 * merged.relative_error * true
+
+    small = HyperLogLog(12).update(pd.Series([1, 2, 3])).merge(HyperLogLog(12).update(pd.Series([3, 4])))
+    assert small.is_exact and small.count() == 4
+
+    with pytest.raises(ValueError):
+        HyperLogLog(12).merge(HyperLogLog(10))
+
+
+def test_hyperloglog_ignores_missing_values():
+    counter = HyperLogLog().update(pd.Series(["a", None, "b", np.nan, "a"]))
+    assert counter.count() == 2
+
+
+# ---------------- Space-Saving top values ----------------
+
+def test_topk_exact_without_eviction():
+    values = pd.Series(np.random.default_rng(6).choice(list("abcdefg"), 10_000))
+    sketch = TopKSketch(capacity=20)
+    for chunk in np.array_split(values.to_numpy(), 5):
+        sketch.update(chunk)
+
+    expected = values.value_counts()
+    assert not sketch.truncated
+    pd.testing.assert_series_equal(
+        sketch.top(7).sort_index(), expected.sort_index(), check_names=False
+    )
+    assert sketch.n_distinct == 7
+
+
+def test_topk_bounds_contain_true_counts():
+    rng = np.random.default_rng(7)
+    values = pd.Series(rng.zipf(1.3, 100_000) % 5000)
+    a, b = TopKSketch(capacity=200), TopKSketch(capacity=200)
+    for chunk in np.array_split(values.to_numpy(), 20):
+        a.update(chunk[: len(chunk) // 2])
+        b.update(chunk[len(chunk) // 2:])
+    sketch = a.merge(b)
+
+    true = values.value_counts()
+    bounds = sketch.bounds(10)
+    actual = true.reindex(bounds.index)
+
+    assert sketch.truncated
+    assert (bounds["lower"] <= actual).all() and (actual <= bounds["count"]).all()
+    # The heaviest values are found
+    assert set(true.index[:5]) <= set(bounds.index)
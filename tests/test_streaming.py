@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cognia import StreamingProfiler, profile, quick_eda
+from cognia.streaming import _profile_sections
+
+
+def _fed(frame, chunk_rows, **options):
+    profiler = StreamingProfiler(**options)
+    for start in range(0, len(frame), chunk_rows):
+        profiler.update(frame.iloc[start:start + chunk_rows])
+    return profiler
+
+
+def test_streaming_sections_match_quick_eda(mixed_frame):
+    frame = mixed_frame.assign(grade=mixed_frame["grade"].astype(str))
+    full = quick_eda(frame)
+    streamed = _fed(frame, 300).sections()
+
+    pd.testing.assert_frame_equal(full["missing"], streamed["missing"])
+    columns = ["count", "mean", "std", "min", "max", "skewness", "kurtosis"]
+    pd.testing.assert_frame_equal(
+        full["statistics"][columns], streamed["statistics"][columns], atol=1e-3
+    )
+    pd.testing.assert_frame_equal(
+        full["correlation"]["top_pairs"].reset_index(drop=True),
+        streamed["correlation"]["top_pairs"].reset_index(drop=True)
+    )
+    assert streamed["overview"]["rows"] == len(frame)
+
+
+def test_update_matches_one_pass(mixed_frame):
+    once = profile(mixed_frame)
+    appended = profile(mixed_frame.iloc[:700]).update(mixed_frame.iloc[700:])
+
+    for a, b in zip(once.profiles(), appended.profiles()):
+        assert a.name == b.name and a.count == b.count and a.null_count == b.null_count
+        if a.is_numeric:
+            assert a.mean == pytest.approx(b.mean, nan_ok=True)
+            assert a.std == pytest.approx(b.std, nan_ok=True)
+
+
+@pytest.mark.parametrize("exact_duplicates", [False, True])
+def test_duplicate_counts_exact_for_small_data(exact_duplicates):
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({"a": rng.integers(0, 30, 5000), "b": rng.choice(list("xy"), 5000)})
+    quality = _fed(frame, 700, exact_duplicates=exact_duplicates).data_quality()
+
+    assert quality["duplicate_records"] == frame.duplicated().sum()
+    assert not quality["duplicates_estimated"]
+
+
+def test_unique_rows_show_no_estimated_duplicates():
+    frame = pd.DataFrame({"id": np.arange(200_000)})
+    quality = _fed(frame, 50_000).data_quality()
+
+    assert quality["duplicates_estimated"]
+    assert quality["duplicate_records"] == 0
+
+
+def test_exact_duplicates_on_large_data():
+    rng = np.random.default_rng(1)
+    frame = pd.DataFrame({"a": rng.integers(0, 60_000, 100_000), "b": rng.choice(list("xy"), 100_000)})
+    exact = _fed(frame, 7000, exact_duplicates=True).data_quality()
+    estimated = _fed(frame, 7000).data_quality()
+
+    true = frame.duplicated().sum()
+    assert exact["duplicate_records"] == true
+    assert estimated["duplicates_estimated"]
+    assert abs(estimated["duplicate_records"] - true) < 0.05 * len(frame)
+
+
+def test_signed_zeros_are_duplicates():
+    frame = pd.DataFrame({"a": [0.0, -0.0, np.nan, np.nan, 1.0], "b": ["x", "x", None, None, "y"]})
+    assert profile(frame).data_quality()["duplicate_records"] == 2
+
+
+def test_quantile_error_is_required():
+    with pytest.raises(ValueError):
+        StreamingProfiler(quantile_error=None)
+
+
+def test_sections_of_profiles():
+    profiler = profile(pd.DataFrame({"x": [1.0, 2.0, 3.0, 100.0], "s": list("aabc")}))
+    sections = _profile_sections(
+        profiler.context(), profiler.correlation.matrix(), profiler.data_quality()
+    )
+    assert sections["statistics"].loc["x", "max"] == 100